@@ -6,14 +6,20 @@ Usage:
     # or
     python api/server.py
 """
+import json
 import sys
 from pathlib import Path
-from dataclasses import asdict, is_dataclass
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Annotated
 
-from fastapi import FastAPI, HTTPException
+import msgspec
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, Field, ValidationError
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -21,26 +27,240 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from iscn_authenticator.main import validate_karyotype
 
 
-def to_json_serializable(obj):
-    """Convert dataclass instances to JSON-serializable dicts recursively."""
-    if is_dataclass(obj) and not isinstance(obj, type):
-        return {k: to_json_serializable(v) for k, v in asdict(obj).items()}
-    elif isinstance(obj, list):
-        return [to_json_serializable(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {k: to_json_serializable(v) for k, v in obj.items()}
-    else:
-        return obj
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Defined locally because fastapi.responses.ORJSONResponse is deprecated
+    in recent FastAPI releases.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+# Upper bound on the length of one karyotype string. Longer inputs are
+# rejected with 422 before validation, so they never reach the response cache.
+MAX_KARYOTYPE_LENGTH = 1000
+
+# Upper bound on karyotypes per /validate_batch request
+MAX_BATCH_SIZE = 1000
+
+# Upper bound on the /validate_batch body: MAX_BATCH_SIZE karyotypes of
+# MAX_KARYOTYPE_LENGTH characters, each one JSON-escaped (\uXXXX) in full,
+# plus quotes and separators. msgspec checks the list length only after
+# decoding the whole array, so bodies past this are refused while reading.
+MAX_BATCH_BODY_BYTES = MAX_BATCH_SIZE * (6 * MAX_KARYOTYPE_LENGTH + 4) + 1024
+
+_Karyotype = Annotated[str, msgspec.Meta(max_length=MAX_KARYOTYPE_LENGTH)]
+
+
+class KaryotypeRequest(msgspec.Struct):
+    karyotype: _Karyotype
+
+
+class BatchRequest(msgspec.Struct):
+    karyotypes: Annotated[list[_Karyotype], msgspec.Meta(max_length=MAX_BATCH_SIZE)]
+
+
+# Pydantic mirrors of the request structs, used only to report a body that
+# msgspec rejected in FastAPI's own 422 format
+_PydanticKaryotype = Annotated[str, Field(max_length=MAX_KARYOTYPE_LENGTH)]
 
 
-class KaryotypeRequest(BaseModel):
-    karyotype: str
+class _KaryotypeRequestModel(BaseModel):
+    karyotype: _PydanticKaryotype
 
 
+class _BatchRequestModel(BaseModel):
+    karyotypes: list[_PydanticKaryotype]
+
+
+# Documents the 200 body in OpenAPI only; responses are never validated
+# against it.
 class ValidationResponse(BaseModel):
     valid: bool
     errors: list[str]
     parsed: dict | None
+    explanation: dict | None = None
+
+
+_karyotype_request_decoder = msgspec.json.Decoder(KaryotypeRequest)
+_batch_request_decoder = msgspec.json.Decoder(BatchRequest)
+
+# The 422 FastAPI documents for a model body parameter; the POST routes read
+# the body themselves, so they declare it explicitly. The schema component is
+# emitted for GET /validate's query parameter.
+_VALIDATION_ERROR_RESPONSE = {
+    "description": "Validation Error",
+    "content": {
+        "application/json": {
+            "schema": {"$ref": "#/components/schemas/HTTPValidationError"}
+        }
+    },
+}
+
+_KARYOTYPE_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "required": ["karyotype"],
+                    "properties": {
+                        "karyotype": {
+                            "type": "string",
+                            "maxLength": MAX_KARYOTYPE_LENGTH,
+                        }
+                    },
+                }
+            }
+        },
+    }
+}
+
+_BATCH_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "required": ["karyotypes"],
+                    "properties": {
+                        "karyotypes": {
+                            "type": "array",
+                            "items": {
+                                "type": "string",
+                                "maxLength": MAX_KARYOTYPE_LENGTH,
+                            },
+                            "maxItems": MAX_BATCH_SIZE,
+                        }
+                    },
+                }
+            }
+        },
+    }
+}
+
+
+# msgspec's message for a karyotypes list over MAX_BATCH_SIZE
+_BATCH_TOO_LARGE_ERROR = (
+    f"Expected `array` of length <= {MAX_BATCH_SIZE} - at `$.karyotypes`"
+)
+
+
+async def _read_body(request: Request, max_bytes: int) -> bytes:
+    """Read the request body, refusing it with 413 once it exceeds max_bytes."""
+    too_large = f"Request body exceeds {max_bytes} bytes"
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        raise HTTPException(status_code=413, detail=too_large)
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise HTTPException(status_code=413, detail=too_large)
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _json_invalid(loc: tuple, error: str) -> dict:
+    """FastAPI's error entry for a body that is not valid JSON."""
+    return {
+        "type": "json_invalid",
+        "loc": loc,
+        "msg": "JSON decode error",
+        "input": {},
+        "ctx": {"error": error},
+    }
+
+
+def _reject_json_constant(name: str):
+    # json.loads accepts NaN and Infinity; msgspec does not, and they could
+    # not be echoed back in an error's "input"
+    raise ValueError(f"Invalid JSON constant {name}")
+
+
+def _request_validation_error(
+    model: type[BaseModel], body: bytes, error: ValueError
+) -> RequestValidationError:
+    """Rebuild the errors FastAPI reports when a body parameter of type
+    model fails, so 422 responses keep their list-of-errors shape.
+
+    Mirrors FastAPI's own body handling: an empty body is missing, bad JSON
+    is json_invalid at its offset, and anything else is validated by
+    pydantic with locations under "body".
+    """
+    data = None
+    if body:
+        try:
+            data = json.loads(body, parse_constant=_reject_json_constant)
+        except json.JSONDecodeError as e:
+            return RequestValidationError(
+                [_json_invalid(("body", e.pos), e.msg)], body=e.doc
+            )
+        except ValueError as e:
+            # Invalid UTF-8, NaN or Infinity
+            return RequestValidationError([_json_invalid(("body",), str(e))])
+
+    if data is None:
+        errors = [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+    else:
+        try:
+            model.model_validate(data, from_attributes=True)
+        except ValidationError as e:
+            errors = [
+                {**err, "loc": ("body", *err["loc"])}
+                for err in e.errors(include_url=False)
+            ]
+        else:
+            # JSON that only msgspec rejects
+            errors = [_json_invalid(("body",), str(error))]
+    return RequestValidationError(errors, body=data)
+
+
+def _decode_body(decoder: msgspec.json.Decoder, model: type[BaseModel], body: bytes):
+    """Decode and type-check a JSON request body in one pass.
+
+    Errors are reported as FastAPI would for a model body parameter; see
+    _request_validation_error. That slower path runs only for rejected
+    bodies.
+    """
+    try:
+        return decoder.decode(body)
+    except (msgspec.DecodeError, UnicodeDecodeError) as e:
+        # msgspec raises UnicodeDecodeError itself for invalid UTF-8
+        if str(e) == _BATCH_TOO_LARGE_ERROR:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Batch exceeds {MAX_BATCH_SIZE} karyotypes",
+            )
+        raise _request_validation_error(model, body, e)
+
+
+@lru_cache(maxsize=4096)
+def _validate_to_json(karyotype: str) -> bytes:
+    """Validate a karyotype and serialize the ValidationResult to JSON bytes.
+
+    Validation is deterministic on the input string, so results are memoized.
+    Callers bound the key size: every endpoint rejects karyotypes longer than
+    MAX_KARYOTYPE_LENGTH before calling this.
+    The cache holds the serialized bytes rather than the (mutable)
+    ValidationResult, so a hit can be shared between requests safely.
+    orjson serializes the dataclass tree natively in a single C-level pass.
+    """
+    return orjson.dumps(validate_karyotype(karyotype))
+
+
+def _validation_response(karyotype: str) -> Response:
+    """Build the /validate response, bypassing jsonable_encoder and
+    response-model validation."""
+    return Response(
+        content=_validate_to_json(karyotype),
+        media_type="application/json",
+    )
 
 
 @asynccontextmanager
@@ -57,6 +277,7 @@ app = FastAPI(
     description="Validate International System for Human Cytogenomic Nomenclature strings",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS for Deno Deploy frontend
@@ -77,6 +298,7 @@ async def root():
         "endpoints": {
             "POST /validate": "Validate a karyotype string",
             "GET /validate?karyotype=...": "Validate via query parameter",
+            "POST /validate_batch": "Validate a list of karyotype strings",
             "GET /health": "Health check",
         }
     }
@@ -87,24 +309,58 @@ async def health():
     return {"status": "healthy"}
 
 
-@app.post("/validate", response_model=ValidationResponse)
-async def validate_post(request: KaryotypeRequest):
+@app.post(
+    "/validate",
+    response_model=None,
+    responses={200: {"model": ValidationResponse}, 422: _VALIDATION_ERROR_RESPONSE},
+    openapi_extra=_KARYOTYPE_REQUEST_BODY,
+)
+async def validate_post(request: Request):
     """Validate a karyotype string via POST request."""
-    if not request.karyotype:
+    body = _decode_body(
+        _karyotype_request_decoder, _KaryotypeRequestModel, await request.body()
+    )
+    if not body.karyotype:
         raise HTTPException(status_code=400, detail="No karyotype provided")
 
-    result = validate_karyotype(request.karyotype)
-    return to_json_serializable(result)
+    return _validation_response(body.karyotype)
 
 
-@app.get("/validate", response_model=ValidationResponse)
-async def validate_get(karyotype: str):
+@app.get("/validate", response_model=None, responses={200: {"model": ValidationResponse}})
+async def validate_get(
+    karyotype: Annotated[str, Query(max_length=MAX_KARYOTYPE_LENGTH)],
+):
     """Validate a karyotype string via GET request."""
     if not karyotype:
         raise HTTPException(status_code=400, detail="No karyotype provided")
 
-    result = validate_karyotype(karyotype)
-    return to_json_serializable(result)
+    return _validation_response(karyotype)
+
+
+@app.post(
+    "/validate_batch",
+    response_model=None,
+    responses={
+        200: {"model": list[ValidationResponse]},
+        422: _VALIDATION_ERROR_RESPONSE,
+    },
+    openapi_extra=_BATCH_REQUEST_BODY,
+)
+async def validate_batch(request: Request):
+    """Validate many karyotype strings in one request.
+
+    Results are returned in input order. Each item is served from the same
+    per-karyotype cache as /validate, so the response is assembled by joining
+    pre-serialized JSON documents.
+    """
+    body = _decode_body(
+        _batch_request_decoder,
+        _BatchRequestModel,
+        await _read_body(request, MAX_BATCH_BODY_BYTES),
+    )
+
+    content = b"[" + b",".join(_validate_to_json(k) for k in body.karyotypes) + b"]"
+    return Response(content=content, media_type="application/json")
 
 
 if __name__ == "__main__":
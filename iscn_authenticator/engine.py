@@ -6,42 +6,73 @@ from iscn_authenticator.rules.base import Rule
 
 
 class RuleEngine:
-    """Applies validation rules to a karyotype AST."""
+    """Applies validation rules to a karyotype AST.
+
+    Rules are registered once and read on every validation, so they are kept
+    in immutable tuples that are rebuilt on registration.
+    """
 
     def __init__(self):
-        self._rules: list[Rule] = []
-        self._abnormality_rules: list[Rule] = []
+        self._rules: tuple[Rule, ...] = ()
+        self._abnormality_rules: tuple[Rule, ...] = ()
+        # Abnormality type -> applicable rules, built lazily per type
+        self._abnormality_rules_by_type: dict[str, tuple[Rule, ...]] = {}
 
     def add_rule(self, rule: Rule) -> None:
         """Add a rule to the engine."""
-        self._rules.append(rule)
+        self._rules = (*self._rules, rule)
 
     def add_rules(self, rules: list[Rule]) -> None:
         """Add multiple rules to the engine."""
-        self._rules.extend(rules)
+        self._rules = (*self._rules, *rules)
 
     def add_abnormality_rule(self, rule: Rule) -> None:
         """Add an abnormality rule (applied to each abnormality)."""
-        self._abnormality_rules.append(rule)
+        self._abnormality_rules = (*self._abnormality_rules, rule)
+        self._abnormality_rules_by_type = {}
 
     def add_abnormality_rules(self, rules: list[Rule]) -> None:
         """Add multiple abnormality rules."""
-        self._abnormality_rules.extend(rules)
+        self._abnormality_rules = (*self._abnormality_rules, *rules)
+        self._abnormality_rules_by_type = {}
+
+    def _rules_for_type(self, abnormality_type: str) -> tuple[Rule, ...]:
+        """Abnormality rules applicable to a type, in registration order."""
+        rules = self._abnormality_rules_by_type.get(abnormality_type)
+        if rules is None:
+            rules = tuple(
+                rule for rule in self._abnormality_rules
+                if rule.applicable_types is None or abnormality_type in rule.applicable_types
+            )
+            self._abnormality_rules_by_type[abnormality_type] = rules
+        return rules
+
+    def validate(self, ast: KaryotypeAST, fast_fail: bool = False) -> ValidationResult:
+        """Validate a karyotype AST against all rules.
 
-    def validate(self, ast: KaryotypeAST) -> ValidationResult:
-        """Validate a karyotype AST against all rules."""
+        With fast_fail, stop at the first rule that reports errors; the
+        result then holds only that rule's errors. Callers that need only
+        ``valid`` use this to skip the remaining rules on invalid input.
+        """
+        rules = self._rules
+        rules_for_type = self._rules_for_type
+        abnormalities = ast.abnormalities
         all_errors: list[str] = []
 
         # Apply AST-level rules
-        for rule in self._rules:
+        for rule in rules:
             errors = rule.validate(ast, ast)
             all_errors.extend(errors)
+            if fast_fail and errors:
+                return ValidationResult(valid=False, errors=all_errors, parsed=ast)
 
         # Apply abnormality rules to each abnormality
-        for abnormality in ast.abnormalities:
-            for rule in self._abnormality_rules:
+        for abnormality in abnormalities:
+            for rule in rules_for_type(abnormality.type):
                 errors = rule.validate(ast, abnormality)
                 all_errors.extend(errors)
+                if fast_fail and errors:
+                    return ValidationResult(valid=False, errors=all_errors, parsed=ast)
 
         return ValidationResult(
             valid=len(all_errors) == 0,
@@ -1,6 +1,7 @@
 # iscn_authenticator/main.py
 """ISCN Karyotype Validation API."""
-import re
+from functools import lru_cache
+from typing import Iterable
 from iscn_authenticator.models import ValidationResult, KaryotypeAST
 from iscn_authenticator.parser import KaryotypeParser, ParseError
 from iscn_authenticator.engine import RuleEngine
@@ -13,6 +14,12 @@ _parser = KaryotypeParser()
 _engine = RuleEngine()
 _engine.add_rules(ALL_CHROMOSOME_RULES)
 _engine.add_abnormality_rules(ALL_ABNORMALITY_RULES)
+
+# The parser answers these without parsing, and every one of them passes
+# all chromosome rules, so validation can skip the engine as well
+_NORMAL_KARYOTYPES = frozenset(KaryotypeParser._NORMAL_KARYOTYPES)
+
+
 def validate_karyotype(karyotype: str) -> ValidationResult:
     """
     Validate an ISCN karyotype string.
@@ -32,78 +39,54 @@ def validate_karyotype(karyotype: str) -> ValidationResult:
             parsed=None
         )
 
-    result = _engine.validate(ast)
+    if karyotype in _NORMAL_KARYOTYPES:
+        result = ValidationResult(valid=True, errors=[], parsed=ast)
+    else:
+        result = _engine.validate(ast)
 
-    # Populate explanations
-    if result.parsed:
-        result.explanation = explain(result.parsed)
-        for abn in result.parsed.abnormalities:
+    # Populate explanations; normal karyotypes only need the top-level one
+    result.explanation = explain(ast)
+    if ast.abnormalities:
+        for abn in ast.abnormalities:
             abn.explanation = explain(abn)
 
     return result
 
 
-def is_valid_karyotype(karyotype: str) -> bool:
+def validate_karyotypes(karyotypes: Iterable[str]) -> list[ValidationResult]:
     """
-    Validates a simple ISCN karyotype string.
+    Validate many ISCN karyotype strings, in input order.
 
-    Backward-compatible API that returns only True/False.
-    For detailed errors, use validate_karyotype() instead.
+    Cohort files repeat the same few karyotypes many times, so each
+    distinct string is parsed and validated once; repeated strings share
+    the same ValidationResult object in the returned list.
     """
-    return validate_karyotype(karyotype).valid
-
-
-# Legacy functions kept for compatibility with existing code
-# These can be removed in a future version
-
-def _validate_total_chromosome_number(number_part: str) -> bool:
-    """Validates the total chromosome number part of the karyotype."""
-    return number_part.isdigit()
-
-
-def _validate_sex_chromosomes(sex_chromosome_part: str) -> bool:
-    """Validates the sex chromosomes part of the karyotype."""
-    return bool(re.match(r"^(X|Y)+$", sex_chromosome_part))
-
+    results: dict[str, ValidationResult] = {}
+    output = []
+    for karyotype in karyotypes:
+        result = results.get(karyotype)
+        if result is None:
+            result = results[karyotype] = validate_karyotype(karyotype)
+        output.append(result)
+    return output
 
-def _validate_coherence(total_chromosome_number: int, sex_chromosomes: str) -> bool:
-    """Validates coherence between total chromosome number and sex chromosomes."""
-    if total_chromosome_number == 46:
-        if len(sex_chromosomes) != 2:
-            return False
-    elif total_chromosome_number == 45:
-        if len(sex_chromosomes) != 1:
-            return False
-    return True
 
+@lru_cache(maxsize=2048)
+def is_valid_karyotype(karyotype: str) -> bool:
+    """
+    Validates a simple ISCN karyotype string.
 
-def _validate_deletion_content(content: str) -> bool:
-    """Validates the content string of a deletion, e.g., 'q13' or 'q13q33'."""
-    # Terminal deletion: [pq]\d+(\.\d+)?
-    if re.fullmatch(r"[pq]\d+(\.\d+)?", content):
-        return True
-
-    # Interstitial deletion: [pq]\d+(\.\d+)?[pq]\d+(\.\d+)?
-    if re.fullmatch(r"[pq]\d+(\.\d+)?[pq]\d+(\.\d+)?", content):
-        return True
-
-    return False
-
-
-def _validate_abnormalities(abnormality_parts: list[str]) -> bool:
-    """Validates the abnormality parts of the karyotype."""
-    for part in abnormality_parts:
-        if re.fullmatch(r"^[+-]\d+$", part):
-            continue  # It is a valid numeric abnormality
-
-        del_match = re.fullmatch(r"^del\((\d{1,2}|[XY])\)\((.+)\)$", part)
-        if del_match:
-            content = del_match.group(2)
-            if _validate_deletion_content(content):
-                continue
+    Backward-compatible API that returns only True/False.
+    For detailed errors, use validate_karyotype() instead.
 
-        return False  # If no match, then it's an invalid part
-    return True
+    Only validity is needed, so explanations are not built, and the answer
+    for each string is memoized.
+    """
+    try:
+        ast = _parser.parse(karyotype)
+    except ParseError:
+        return False
+    return _engine.validate(ast, fast_fail=True).valid
 
 
 if __name__ == "__main__":
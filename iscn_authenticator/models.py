@@ -2,7 +2,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class ExplainResult:
     """Result of the Explain module."""
     summary: str                     # One sentence summary
@@ -11,7 +11,7 @@ class ExplainResult:
     refs: dict[str, list[str]]       # External references: {"omim": [...]}
     confidence: str                  # "template" | "curated" | "none"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Breakpoint:
     """Represents a chromosomal breakpoint like p11.2 or q34."""
     arm: str                         # "p", "q", "cen", "ter"
@@ -20,7 +20,7 @@ class Breakpoint:
     subband: Optional[str]           # "1", "11", etc.
     uncertain: bool                  # Has ? in designation
 
-@dataclass
+@dataclass(slots=True)
 class Abnormality:
     """Represents a chromosomal abnormality."""
     type: str                        # "+", "-", "del", "dup", "inv", "t", etc.
@@ -30,8 +30,11 @@ class Abnormality:
     uncertain: bool                  # Has ? marker
     copy_count: Optional[int]        # For x2, x3 notation
     raw: str                         # Original string
+    # Set by validate_karyotype. A declared field, so asdict() and orjson
+    # serialize it, matching Abnormality in docs/openapi.yaml
+    explanation: Optional[ExplainResult] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Modifiers:
     """Karyotype-level modifiers."""
     mosaic: bool = False             # mos
@@ -39,7 +42,7 @@ class Modifiers:
     constitutional: bool = False     # c suffix
     incomplete: bool = False         # inc
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CellLine:
     """Represents a cell line in mosaic/chimera notation."""
     chromosome_count: int
@@ -48,7 +51,7 @@ class CellLine:
     count: int                       # Number in brackets [10]
     is_donor: bool = False           # For chimera: after //
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class KaryotypeAST:
     """Abstract syntax tree for a parsed karyotype."""
     chromosome_count: int | str      # int or range "45~48"
@@ -57,7 +60,7 @@ class KaryotypeAST:
     cell_lines: Optional[list[CellLine]]
     modifiers: Optional[Modifiers]
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of karyotype validation."""
     valid: bool
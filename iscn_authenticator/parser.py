@@ -1,11 +1,12 @@
 # iscn_authenticator/parser.py
 """Parser for ISCN karyotype strings."""
 import re
+from functools import lru_cache
 from typing import Optional
-from iscn_authenticator.models import KaryotypeAST, Abnormality, Breakpoint, Modifiers, CellLine
+from iscn_authenticator.models import KaryotypeAST, Abnormality, Breakpoint, CellLine
 
 # Pattern for cell line count: [10], [20], etc.
-CELL_LINE_COUNT_PATTERN = re.compile(r'^(.+?)\[(\d+)\]$')
+CELL_LINE_COUNT_PATTERN = re.compile(r'(.+?)\[(\d+)\]', re.ASCII)
 
 
 class ParseError(Exception):
@@ -13,67 +14,138 @@ class ParseError(Exception):
     pass
 
 
+def _is_ascii_digits(s: str) -> bool:
+    """True for a non-empty string of ASCII digits 0-9."""
+    return s.isdigit() and s.isascii()
+
+
+@lru_cache(maxsize=1024)
+def _parse_breakpoint(bp_str: str) -> Breakpoint:
+    """Parse a single breakpoint like 'q13' or 'p11.2'.
+
+    Scans the grammar [pq]<digits>[.<digits>] by hand; this is
+    the innermost call of every structural abnormality and a regex match
+    costs more than the string checks below. Breakpoint is frozen, so
+    results are memoized and the same instance is shared wherever a
+    designation repeats.
+    """
+    arm = bp_str[:1]
+    region_band, dot, subband = bp_str[1:].partition('.')
+    if (
+        arm not in ('p', 'q')
+        or not _is_ascii_digits(region_band)
+        or (dot and not _is_ascii_digits(subband))
+    ):
+        raise ParseError(f"Invalid breakpoint format: '{bp_str}'")
+    if not dot:
+        subband = None
+
+    # Split region and band (e.g., "13" -> region=1, band=3)
+    if len(region_band) >= 2:
+        region = int(region_band[0])
+        band = int(region_band[1:])
+    else:
+        region = int(region_band)
+        band = 0
+
+    return Breakpoint(
+        arm=arm,
+        region=region,
+        band=band,
+        subband=subband,
+        uncertain=False
+    )
+
+
 class KaryotypeParser:
-    """Parses ISCN karyotype strings into AST."""
+    """Parses ISCN karyotype strings into AST.
+
+    With strict=False, an abnormality that fails to parse is recorded as
+    type "unknown" instead of raising ParseError, for batch tools that
+    want to skip bad components. The count and sex chromosome fields are
+    always required.
+    """
 
     # Regex patterns
-    SEX_CHROMOSOMES_PATTERN = re.compile(r'^[XYU]+$')
-    NUMERICAL_ABNORMALITY_PATTERN = re.compile(r'^([+-])(\d{1,2}|[XY])$')
-    DELETION_PATTERN = re.compile(r'^del\((\d{1,2}|[XY])\)\(([^)]+)\)$')
-    DUPLICATION_PATTERN = re.compile(r'^dup\((\d{1,2}|[XY])\)\(([^)]+)\)$')
-    INVERSION_PATTERN = re.compile(r'^inv\((\d{1,2}|[XY])\)\(([^)]+)\)$')
-    TRANSLOCATION_PATTERN = re.compile(r'^t\(([^)]+)\)\(([^)]+)\)$')
-    BREAKPOINT_PATTERN = re.compile(r'^([pq])(\d+)(?:\.(\d+))?$')
+    SEX_CHROMOSOMES = frozenset('XYU')
+    # Dispatch for the forms that are neither keyword(...) nor a fixed
+    # literal: the name of the matched group selects the parser in
+    # _ABNORMALITY_PARSERS
+    ABNORMALITY_DISPATCH_PATTERN = re.compile(
+        r'(?P<marker>\+\d*mar\d*)$'
+        r'|(?P<psu_dic>psu\s*dic)\(',
+        re.ASCII,
+    )
+    DELETION_PATTERN = re.compile(r'del\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
+    DUPLICATION_PATTERN = re.compile(r'dup\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
+    INVERSION_PATTERN = re.compile(r'inv\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
+    TRANSLOCATION_PATTERN = re.compile(r't\(([^)]+)\)\(([^)]+)\)', re.ASCII)
+    # Concatenated breakpoints: q13q33 (two) or p13q21q31 (three)
+    DOUBLE_BREAKPOINT_PATTERN = re.compile(r'([pq]\d+(?:\.\d+)?)([pq]\d+(?:\.\d+)?)', re.ASCII)
+    TRIPLE_BREAKPOINT_PATTERN = re.compile(r'([pq]\d+(?:\.\d+)?)([pq]\d+(?:\.\d+)?)([pq]\d+(?:\.\d+)?)', re.ASCII)
     # Isochromosome: i(17q) short form or i(17)(q10) long form
-    ISOCHROMOSOME_SHORT_PATTERN = re.compile(r'^i\((\d{1,2}|[XY])([pq])\)$')
-    ISOCHROMOSOME_LONG_PATTERN = re.compile(r'^i\((\d{1,2}|[XY])\)\(([^)]+)\)$')
+    ISOCHROMOSOME_SHORT_PATTERN = re.compile(r'i\((\d{1,2}|[XY])([pq])\)', re.ASCII)
+    ISOCHROMOSOME_LONG_PATTERN = re.compile(r'i\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
     # Ring chromosome: r(1) simple or r(1)(p36q42) with breakpoints
-    RING_SIMPLE_PATTERN = re.compile(r'^r\((\d{1,2}|[XY])\)$')
-    RING_BREAKPOINT_PATTERN = re.compile(r'^r\((\d{1,2}|[XY])\)\(([^)]+)\)$')
+    RING_SIMPLE_PATTERN = re.compile(r'r\((\d{1,2}|[XY])\)', re.ASCII)
+    RING_BREAKPOINT_PATTERN = re.compile(r'r\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
     # Marker chromosome: +mar, +2mar, +mar1
-    MARKER_PATTERN = re.compile(r'^\+(\d*)mar(\d*)$')
+    MARKER_PATTERN = re.compile(r'\+(\d*)mar(\d*)', re.ASCII)
     # Derivative chromosome: der(22)t(9;22)(...) or der(1)del(1)(...)
-    DERIVATIVE_PATTERN = re.compile(r'^der\((\d{1,2}|[XY])\)(.+)$')
-    # Double minutes: dmin
-    DMIN_PATTERN = re.compile(r'^dmin$')
-    # Homogeneously staining region: hsr or hsr(1)(p22)
-    HSR_SIMPLE_PATTERN = re.compile(r'^hsr$')
-    HSR_LOCATION_PATTERN = re.compile(r'^hsr\((\d{1,2}|[XY])\)\(([^)]+)\)$')
+    DERIVATIVE_PATTERN = re.compile(r'der\((\d{1,2}|[XY])\)(.+)', re.ASCII)
+    # Homogeneously staining region with location: hsr(1)(p22)
+    HSR_LOCATION_PATTERN = re.compile(r'hsr\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
     # Insertion: ins(5;2)(p14;q21q31) or ins(2)(p13q21q31)
-    INSERTION_PATTERN = re.compile(r'^ins\(([^)]+)\)\(([^)]+)\)$')
+    INSERTION_PATTERN = re.compile(r'ins\(([^)]+)\)\(([^)]+)\)', re.ASCII)
     # Additional material of unknown origin: add(7)(p22)
-    ADD_PATTERN = re.compile(r'^add\((\d{1,2}|[XY])\)\(([^)]+)\)$')
+    ADD_PATTERN = re.compile(r'add\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
     # Triplication: trp(1)(q21q32)
-    TRIPLICATION_PATTERN = re.compile(r'^trp\((\d{1,2}|[XY])\)\(([^)]+)\)$')
+    TRIPLICATION_PATTERN = re.compile(r'trp\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
     # Dicentric chromosome: dic(13;14)(q14;q11)
-    DICENTRIC_PATTERN = re.compile(r'^dic\(([^)]+)\)\(([^)]+)\)$')
+    DICENTRIC_PATTERN = re.compile(r'dic\(([^)]+)\)\(([^)]+)\)', re.ASCII)
     # Isodicentric chromosome: idic(Y)(q11)
-    ISODICENTRIC_PATTERN = re.compile(r'^idic\((\d{1,2}|[XY])\)\(([^)]+)\)$')
+    ISODICENTRIC_PATTERN = re.compile(r'idic\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
     # Fragile site: fra(X)(q27.3)
-    FRAGILE_SITE_PATTERN = re.compile(r'^fra\((\d{1,2}|[XY])\)\(([^)]+)\)$')
+    FRAGILE_SITE_PATTERN = re.compile(r'fra\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
     # Robertsonian translocation: rob(13;14)(q10;q10)
-    ROBERTSONIAN_PATTERN = re.compile(r'^rob\(([^)]+)\)\(([^)]+)\)$')
+    ROBERTSONIAN_PATTERN = re.compile(r'rob\(([^)]+)\)\(([^)]+)\)', re.ASCII)
     # Quadruplication: qdp(1)(q21q32)
-    QUADRUPLICATION_PATTERN = re.compile(r'^qdp\((\d{1,2}|[XY])\)\(([^)]+)\)$')
+    QUADRUPLICATION_PATTERN = re.compile(r'qdp\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
     # Pseudodicentric: psu dic(13;14)(q14;q11)
-    PSEUDODICENTRIC_PATTERN = re.compile(r'^psu\s*dic\(([^)]+)\)\(([^)]+)\)$')
+    PSEUDODICENTRIC_PATTERN = re.compile(r'psu\s*dic\(([^)]+)\)\(([^)]+)\)', re.ASCII)
     # Acentric fragment: ace(1)(q21q31)
-    ACENTRIC_PATTERN = re.compile(r'^ace\((\d{1,2}|[XY])\)\(([^)]+)\)$')
+    ACENTRIC_PATTERN = re.compile(r'ace\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
     # Telomeric association: tas(13;14)(p11;p11)
-    TELOMERIC_ASSOC_PATTERN = re.compile(r'^tas\(([^)]+)\)\(([^)]+)\)$')
+    TELOMERIC_ASSOC_PATTERN = re.compile(r'tas\(([^)]+)\)\(([^)]+)\)', re.ASCII)
     # Fission: fis(1)(p10) or fis(1)(q10)
-    FISSION_PATTERN = re.compile(r'^fis\((\d{1,2}|[XY])\)\(([^)]+)\)$')
+    FISSION_PATTERN = re.compile(r'fis\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
     # Neocentromere: neo(1)(q21)
-    NEOCENTROMERE_PATTERN = re.compile(r'^neo\((\d{1,2}|[XY])\)\(([^)]+)\)$')
-    # Incomplete karyotype: inc
-    INCOMPLETE_PATTERN = re.compile(r'^inc$')
+    NEOCENTROMERE_PATTERN = re.compile(r'neo\((\d{1,2}|[XY])\)\(([^)]+)\)', re.ASCII)
+
+    # Karyotypes without abnormalities that make up most real-world input,
+    # mapped to their (chromosome_count, sex_chromosomes) fields
+    _NORMAL_KARYOTYPES = {
+        '46,XX': (46, 'XX'),
+        '46,XY': (46, 'XY'),
+        '45,X': (45, 'X'),
+        '47,XXY': (47, 'XXY'),
+        '47,XXX': (47, 'XXX'),
+        '47,XYY': (47, 'XYY'),
+    }
+
+    def __init__(self, strict: bool = True):
+        self.strict = strict
 
     def parse(self, karyotype: str) -> KaryotypeAST:
         """Parse a karyotype string into an AST."""
-        if not karyotype or not karyotype.strip():
+        karyotype = karyotype.strip() if karyotype else ''
+        if not karyotype:
             raise ParseError("Karyotype string is empty")
 
-        karyotype = karyotype.strip()
+        # Most inputs are a plain count and sex complement
+        normal = self._NORMAL_KARYOTYPES.get(karyotype)
+        if normal is not None:
+            return KaryotypeAST(normal[0], normal[1], [], None, None)
 
         # Check for mosaicism (cell lines separated by /)
         if '/' in karyotype:
@@ -87,27 +159,25 @@ class KaryotypeParser:
 
         # Extract cell count if present (e.g., "46,XX[10]")
         if extract_count:
-            count_match = CELL_LINE_COUNT_PATTERN.match(karyotype)
+            count_match = CELL_LINE_COUNT_PATTERN.fullmatch(karyotype)
             if count_match:
                 karyotype = count_match.group(1)
                 count = int(count_match.group(2))
 
-        # Split on comma
-        if ',' not in karyotype:
+        # Split on comma; only the abnormality tail needs a full split
+        count_str, sep, rest = karyotype.partition(',')
+        if not sep:
             raise ParseError("Missing comma separator between chromosome count and sex chromosomes")
-
-        parts = karyotype.split(',')
+        sex_str, sep, abnormalities_str = rest.partition(',')
 
         # Parse chromosome count
-        chromosome_count = self._parse_chromosome_count(parts[0])
+        chromosome_count = self._parse_chromosome_count(count_str)
 
         # Parse sex chromosomes
-        sex_chromosomes = self._parse_sex_chromosomes(parts[1])
+        sex_chromosomes = self._parse_sex_chromosomes(sex_str)
 
         # Parse abnormalities (if any)
-        abnormalities = []
-        if len(parts) > 2:
-            abnormalities = self._parse_abnormalities(parts[2:])
+        abnormalities = self._parse_abnormalities(abnormalities_str) if sep else []
 
         ast = KaryotypeAST(
             chromosome_count=chromosome_count,
@@ -123,20 +193,7 @@ class KaryotypeParser:
 
     def _parse_mosaic(self, karyotype: str) -> KaryotypeAST:
         """Parse a mosaic karyotype with multiple cell lines."""
-        cell_line_strs = karyotype.split('/')
-        cell_lines = []
-
-        for line_str in cell_line_strs:
-            line_str = line_str.strip()
-            ast, count = self._parse_single_karyotype(line_str, extract_count=True)
-            cell_line = CellLine(
-                chromosome_count=ast.chromosome_count,
-                sex_chromosomes=ast.sex_chromosomes,
-                abnormalities=ast.abnormalities,
-                count=count,
-                is_donor=False
-            )
-            cell_lines.append(cell_line)
+        cell_lines = [self._parse_cell_line(line_str) for line_str in karyotype.split('/')]
 
         # Use the first cell line as the main karyotype info
         first = cell_lines[0]
@@ -148,6 +205,17 @@ class KaryotypeParser:
             modifiers=None
         )
 
+    def _parse_cell_line(self, line_str: str) -> CellLine:
+        """Parse one cell line of a mosaic, e.g. '47,XX,+21[10]'."""
+        ast, count = self._parse_single_karyotype(line_str.strip(), extract_count=True)
+        return CellLine(
+            chromosome_count=ast.chromosome_count,
+            sex_chromosomes=ast.sex_chromosomes,
+            abnormalities=ast.abnormalities,
+            count=count,
+            is_donor=False
+        )
+
     def _parse_chromosome_count(self, count_str: str) -> int | str:
         """Parse chromosome count (number or range)."""
         count_str = count_str.strip()
@@ -156,8 +224,9 @@ class KaryotypeParser:
         if '~' in count_str:
             return count_str
 
-        # Handle numeric count
-        if not count_str.isdigit():
+        # Handle numeric count; checked before int(), which would also accept
+        # a sign, digit-group underscores and non-ASCII digits
+        if not _is_ascii_digits(count_str):
             raise ParseError(f"Invalid chromosome count: '{count_str}' is not a number")
 
         return int(count_str)
@@ -166,40 +235,18 @@ class KaryotypeParser:
         """Parse sex chromosome designation."""
         sex_str = sex_str.strip()
 
-        if not self.SEX_CHROMOSOMES_PATTERN.match(sex_str):
+        if not sex_str or not self.SEX_CHROMOSOMES.issuperset(sex_str):
             raise ParseError(f"Invalid sex chromosomes: '{sex_str}' must contain only X, Y, or U")
 
         return sex_str
 
-    def _parse_breakpoint(self, bp_str: str) -> Breakpoint:
-        """Parse a single breakpoint like 'q13' or 'p11.2'."""
-        match = self.BREAKPOINT_PATTERN.match(bp_str)
-        if not match:
-            raise ParseError(f"Invalid breakpoint format: '{bp_str}'")
-
-        arm = match.group(1)
-        region_band = match.group(2)
-        subband = match.group(3)
-
-        # Split region and band (e.g., "13" -> region=1, band=3)
-        if len(region_band) >= 2:
-            region = int(region_band[0])
-            band = int(region_band[1:])
-        else:
-            region = int(region_band)
-            band = 0
-
-        return Breakpoint(
-            arm=arm,
-            region=region,
-            band=band,
-            subband=subband,
-            uncertain=False
-        )
+    # Parse a single breakpoint like 'q13' or 'p11.2'; bound directly to the
+    # memoized module scanner so each call skips a wrapper frame
+    _parse_breakpoint = staticmethod(_parse_breakpoint)
 
-    def _parse_deletion(self, part: str) -> Abnormality:
+    def _parse_deletion(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse a deletion abnormality."""
-        match = self.DELETION_PATTERN.match(part)
+        match = self.DELETION_PATTERN.fullmatch(part)
         if not match:
             raise ParseError(f"Invalid deletion format: '{part}'")
 
@@ -207,29 +254,30 @@ class KaryotypeParser:
         breakpoint_str = match.group(2)
 
         # Parse breakpoints (could be single or double)
-        breakpoints = []
         # Check for interstitial deletion (two breakpoints like q13q33)
-        double_bp = re.match(r'^([pq]\d+(?:\.\d+)?)([pq]\d+(?:\.\d+)?)$', breakpoint_str)
+        double_bp = self.DOUBLE_BREAKPOINT_PATTERN.fullmatch(breakpoint_str)
         if double_bp:
-            breakpoints.append(self._parse_breakpoint(double_bp.group(1)))
-            breakpoints.append(self._parse_breakpoint(double_bp.group(2)))
+            breakpoints = [
+                self._parse_breakpoint(double_bp.group(1)),
+                self._parse_breakpoint(double_bp.group(2)),
+            ]
         else:
             # Single breakpoint (terminal deletion)
-            breakpoints.append(self._parse_breakpoint(breakpoint_str))
+            breakpoints = [self._parse_breakpoint(breakpoint_str)]
 
         return Abnormality(
             type="del",
             chromosome=chromosome,
             breakpoints=breakpoints,
-            inheritance=None,
-            uncertain=False,
+            inheritance=inheritance,
+            uncertain=uncertain,
             copy_count=None,
-            raw=part
+            raw=raw
         )
 
-    def _parse_duplication(self, part: str) -> Abnormality:
+    def _parse_duplication(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse a duplication abnormality."""
-        match = self.DUPLICATION_PATTERN.match(part)
+        match = self.DUPLICATION_PATTERN.fullmatch(part)
         if not match:
             raise ParseError(f"Invalid duplication format: '{part}'")
 
@@ -237,27 +285,28 @@ class KaryotypeParser:
         breakpoint_str = match.group(2)
 
         # Parse breakpoints (could be single or double)
-        breakpoints = []
-        double_bp = re.match(r'^([pq]\d+(?:\.\d+)?)([pq]\d+(?:\.\d+)?)$', breakpoint_str)
+        double_bp = self.DOUBLE_BREAKPOINT_PATTERN.fullmatch(breakpoint_str)
         if double_bp:
-            breakpoints.append(self._parse_breakpoint(double_bp.group(1)))
-            breakpoints.append(self._parse_breakpoint(double_bp.group(2)))
+            breakpoints = [
+                self._parse_breakpoint(double_bp.group(1)),
+                self._parse_breakpoint(double_bp.group(2)),
+            ]
         else:
-            breakpoints.append(self._parse_breakpoint(breakpoint_str))
+            breakpoints = [self._parse_breakpoint(breakpoint_str)]
 
         return Abnormality(
             type="dup",
             chromosome=chromosome,
             breakpoints=breakpoints,
-            inheritance=None,
-            uncertain=False,
+            inheritance=inheritance,
+            uncertain=uncertain,
             copy_count=None,
-            raw=part
+            raw=raw
         )
 
-    def _parse_inversion(self, part: str) -> Abnormality:
+    def _parse_inversion(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse an inversion abnormality."""
-        match = self.INVERSION_PATTERN.match(part)
+        match = self.INVERSION_PATTERN.fullmatch(part)
         if not match:
             raise ParseError(f"Invalid inversion format: '{part}'")
 
@@ -265,11 +314,12 @@ class KaryotypeParser:
         breakpoint_str = match.group(2)
 
         # Inversions always have two breakpoints
-        breakpoints = []
-        double_bp = re.match(r'^([pq]\d+(?:\.\d+)?)([pq]\d+(?:\.\d+)?)$', breakpoint_str)
+        double_bp = self.DOUBLE_BREAKPOINT_PATTERN.fullmatch(breakpoint_str)
         if double_bp:
-            breakpoints.append(self._parse_breakpoint(double_bp.group(1)))
-            breakpoints.append(self._parse_breakpoint(double_bp.group(2)))
+            breakpoints = [
+                self._parse_breakpoint(double_bp.group(1)),
+                self._parse_breakpoint(double_bp.group(2)),
+            ]
         else:
             raise ParseError(f"Inversion requires two breakpoints: '{part}'")
 
@@ -277,15 +327,15 @@ class KaryotypeParser:
             type="inv",
             chromosome=chromosome,
             breakpoints=breakpoints,
-            inheritance=None,
-            uncertain=False,
+            inheritance=inheritance,
+            uncertain=uncertain,
             copy_count=None,
-            raw=part
+            raw=raw
         )
 
-    def _parse_translocation(self, part: str) -> Abnormality:
+    def _parse_translocation(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse a translocation abnormality."""
-        match = self.TRANSLOCATION_PATTERN.match(part)
+        match = self.TRANSLOCATION_PATTERN.fullmatch(part)
         if not match:
             raise ParseError(f"Invalid translocation format: '{part}'")
 
@@ -300,16 +350,16 @@ class KaryotypeParser:
             type="t",
             chromosome=chromosomes_str,
             breakpoints=breakpoints,
-            inheritance=None,
-            uncertain=False,
+            inheritance=inheritance,
+            uncertain=uncertain,
             copy_count=None,
-            raw=part
+            raw=raw
         )
 
-    def _parse_isochromosome(self, part: str) -> Abnormality:
+    def _parse_isochromosome(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse an isochromosome abnormality."""
         # Try short form first: i(17q) or i(Xq)
-        short_match = self.ISOCHROMOSOME_SHORT_PATTERN.match(part)
+        short_match = self.ISOCHROMOSOME_SHORT_PATTERN.fullmatch(part)
         if short_match:
             chromosome = short_match.group(1)
             arm = short_match.group(2)
@@ -325,14 +375,14 @@ class KaryotypeParser:
                 type="i",
                 chromosome=chromosome,
                 breakpoints=[breakpoint],
-                inheritance=None,
-                uncertain=False,
+                inheritance=inheritance,
+                uncertain=uncertain,
                 copy_count=None,
-                raw=part
+                raw=raw
             )
 
         # Try long form: i(17)(q10)
-        long_match = self.ISOCHROMOSOME_LONG_PATTERN.match(part)
+        long_match = self.ISOCHROMOSOME_LONG_PATTERN.fullmatch(part)
         if long_match:
             chromosome = long_match.group(1)
             breakpoint_str = long_match.group(2)
@@ -341,61 +391,64 @@ class KaryotypeParser:
                 type="i",
                 chromosome=chromosome,
                 breakpoints=[breakpoint],
-                inheritance=None,
-                uncertain=False,
+                inheritance=inheritance,
+                uncertain=uncertain,
                 copy_count=None,
-                raw=part
+                raw=raw
             )
 
         raise ParseError(f"Invalid isochromosome format: '{part}'")
 
-    def _parse_ring(self, part: str) -> Abnormality:
+    def _parse_ring(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse a ring chromosome abnormality."""
         # Try simple form first: r(1)
-        simple_match = self.RING_SIMPLE_PATTERN.match(part)
+        simple_match = self.RING_SIMPLE_PATTERN.fullmatch(part)
         if simple_match:
             chromosome = simple_match.group(1)
             return Abnormality(
                 type="r",
                 chromosome=chromosome,
                 breakpoints=[],
-                inheritance=None,
-                uncertain=False,
+                inheritance=inheritance,
+                uncertain=uncertain,
                 copy_count=None,
-                raw=part
+                raw=raw
             )
 
         # Try breakpoint form: r(1)(p36q42)
-        bp_match = self.RING_BREAKPOINT_PATTERN.match(part)
+        bp_match = self.RING_BREAKPOINT_PATTERN.fullmatch(part)
         if bp_match:
             chromosome = bp_match.group(1)
             breakpoint_str = bp_match.group(2)
             # Parse two breakpoints (p arm and q arm)
-            breakpoints = []
-            double_bp = re.match(r'^([pq]\d+(?:\.\d+)?)([pq]\d+(?:\.\d+)?)$', breakpoint_str)
+            double_bp = self.DOUBLE_BREAKPOINT_PATTERN.fullmatch(breakpoint_str)
             if double_bp:
-                breakpoints.append(self._parse_breakpoint(double_bp.group(1)))
-                breakpoints.append(self._parse_breakpoint(double_bp.group(2)))
+                breakpoints = [
+                    self._parse_breakpoint(double_bp.group(1)),
+                    self._parse_breakpoint(double_bp.group(2)),
+                ]
+            else:
+                breakpoints = []
             return Abnormality(
                 type="r",
                 chromosome=chromosome,
                 breakpoints=breakpoints,
-                inheritance=None,
-                uncertain=False,
+                inheritance=inheritance,
+                uncertain=uncertain,
                 copy_count=None,
-                raw=part
+                raw=raw
             )
 
         raise ParseError(f"Invalid ring chromosome format: '{part}'")
 
-    def _parse_insertion(self, part: str) -> Abnormality:
+    def _parse_insertion(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse an insertion abnormality.
 
         Formats:
         - ins(5;2)(p14;q21q31) - interchromosomal: segment from chr 2 inserted into chr 5
         - ins(2)(p13q21q31) - intrachromosomal: direct insertion within same chromosome
         """
-        match = self.INSERTION_PATTERN.match(part)
+        match = self.INSERTION_PATTERN.fullmatch(part)
         if not match:
             raise ParseError(f"Invalid insertion format: '{part}'")
 
@@ -403,30 +456,34 @@ class KaryotypeParser:
         breakpoints_str = match.group(2)  # e.g., "p14;q21q31" or "p13q21q31"
 
         # Parse breakpoints
-        breakpoints = []
         if ';' in breakpoints_str:
             # Interchromosomal: breakpoints separated by semicolon
             # Format: insertion_site;segment_start segment_end (e.g., "p14;q21q31")
             bp_parts = breakpoints_str.split(';')
             # First part is insertion site
-            breakpoints.append(self._parse_breakpoint(bp_parts[0].strip()))
+            site = self._parse_breakpoint(bp_parts[0].strip())
             # Second part contains two breakpoints (segment boundaries)
             segment_str = bp_parts[1].strip()
-            double_bp = re.match(r'^([pq]\d+(?:\.\d+)?)([pq]\d+(?:\.\d+)?)$', segment_str)
+            double_bp = self.DOUBLE_BREAKPOINT_PATTERN.fullmatch(segment_str)
             if double_bp:
-                breakpoints.append(self._parse_breakpoint(double_bp.group(1)))
-                breakpoints.append(self._parse_breakpoint(double_bp.group(2)))
+                breakpoints = [
+                    site,
+                    self._parse_breakpoint(double_bp.group(1)),
+                    self._parse_breakpoint(double_bp.group(2)),
+                ]
             else:
                 # Single breakpoint after semicolon
-                breakpoints.append(self._parse_breakpoint(segment_str))
+                breakpoints = [site, self._parse_breakpoint(segment_str)]
         else:
             # Intrachromosomal: three consecutive breakpoints (e.g., "p13q21q31")
             # Try to parse three breakpoints
-            triple_bp = re.match(r'^([pq]\d+(?:\.\d+)?)([pq]\d+(?:\.\d+)?)([pq]\d+(?:\.\d+)?)$', breakpoints_str)
+            triple_bp = self.TRIPLE_BREAKPOINT_PATTERN.fullmatch(breakpoints_str)
             if triple_bp:
-                breakpoints.append(self._parse_breakpoint(triple_bp.group(1)))
-                breakpoints.append(self._parse_breakpoint(triple_bp.group(2)))
-                breakpoints.append(self._parse_breakpoint(triple_bp.group(3)))
+                breakpoints = [
+                    self._parse_breakpoint(triple_bp.group(1)),
+                    self._parse_breakpoint(triple_bp.group(2)),
+                    self._parse_breakpoint(triple_bp.group(3)),
+                ]
             else:
                 raise ParseError(f"Invalid insertion breakpoints: '{breakpoints_str}'")
 
@@ -434,18 +491,18 @@ class KaryotypeParser:
             type="ins",
             chromosome=chromosomes_str,
             breakpoints=breakpoints,
-            inheritance=None,
-            uncertain=False,
+            inheritance=inheritance,
+            uncertain=uncertain,
             copy_count=None,
-            raw=part
+            raw=raw
         )
 
-    def _parse_add(self, part: str) -> Abnormality:
+    def _parse_add(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse additional material of unknown origin.
 
         Format: add(7)(p22) - additional material attached at chr 7 p22
         """
-        match = self.ADD_PATTERN.match(part)
+        match = self.ADD_PATTERN.fullmatch(part)
         if not match:
             raise ParseError(f"Invalid additional material format: '{part}'")
 
@@ -457,18 +514,18 @@ class KaryotypeParser:
             type="add",
             chromosome=chromosome,
             breakpoints=[breakpoint],
-            inheritance=None,
-            uncertain=False,
+            inheritance=inheritance,
+            uncertain=uncertain,
             copy_count=None,
-            raw=part
+            raw=raw
         )
 
-    def _parse_triplication(self, part: str) -> Abnormality:
+    def _parse_triplication(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse a triplication abnormality.
 
         Format: trp(1)(q21q32) - triplication of segment q21 to q32 on chr 1
         """
-        match = self.TRIPLICATION_PATTERN.match(part)
+        match = self.TRIPLICATION_PATTERN.fullmatch(part)
         if not match:
             raise ParseError(f"Invalid triplication format: '{part}'")
 
@@ -476,11 +533,12 @@ class KaryotypeParser:
         breakpoint_str = match.group(2)
 
         # Parse two breakpoints (segment boundaries)
-        breakpoints = []
-        double_bp = re.match(r'^([pq]\d+(?:\.\d+)?)([pq]\d+(?:\.\d+)?)$', breakpoint_str)
+        double_bp = self.DOUBLE_BREAKPOINT_PATTERN.fullmatch(breakpoint_str)
         if double_bp:
-            breakpoints.append(self._parse_breakpoint(double_bp.group(1)))
-            breakpoints.append(self._parse_breakpoint(double_bp.group(2)))
+            breakpoints = [
+                self._parse_breakpoint(double_bp.group(1)),
+                self._parse_breakpoint(double_bp.group(2)),
+            ]
         else:
             raise ParseError(f"Triplication requires two breakpoints: '{part}'")
 
@@ -488,18 +546,18 @@ class KaryotypeParser:
             type="trp",
             chromosome=chromosome,
             breakpoints=breakpoints,
-            inheritance=None,
-            uncertain=False,
+            inheritance=inheritance,
+            uncertain=uncertain,
             copy_count=None,
-            raw=part
+            raw=raw
         )
 
-    def _parse_dicentric(self, part: str) -> Abnormality:
+    def _parse_dicentric(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse a dicentric chromosome abnormality.
 
         Format: dic(13;14)(q14;q11) - dicentric formed from chr 13 and 14
         """
-        match = self.DICENTRIC_PATTERN.match(part)
+        match = self.DICENTRIC_PATTERN.fullmatch(part)
         if not match:
             raise ParseError(f"Invalid dicentric format: '{part}'")
 
@@ -514,18 +572,18 @@ class KaryotypeParser:
             type="dic",
             chromosome=chromosomes_str,
             breakpoints=breakpoints,
-            inheritance=None,
-            uncertain=False,
+            inheritance=inheritance,
+            uncertain=uncertain,
             copy_count=None,
-            raw=part
+            raw=raw
         )
 
-    def _parse_isodicentric(self, part: str) -> Abnormality:
+    def _parse_isodicentric(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse an isodicentric chromosome abnormality.
 
         Format: idic(Y)(q11) - isodicentric Y with breakpoint at q11
         """
-        match = self.ISODICENTRIC_PATTERN.match(part)
+        match = self.ISODICENTRIC_PATTERN.fullmatch(part)
         if not match:
             raise ParseError(f"Invalid isodicentric format: '{part}'")
 
@@ -537,18 +595,18 @@ class KaryotypeParser:
             type="idic",
             chromosome=chromosome,
             breakpoints=[breakpoint],
-            inheritance=None,
-            uncertain=False,
+            inheritance=inheritance,
+            uncertain=uncertain,
             copy_count=None,
-            raw=part
+            raw=raw
         )
 
-    def _parse_fragile_site(self, part: str) -> Abnormality:
+    def _parse_fragile_site(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse a fragile site.
 
         Format: fra(X)(q27.3) - fragile site at Xq27.3
         """
-        match = self.FRAGILE_SITE_PATTERN.match(part)
+        match = self.FRAGILE_SITE_PATTERN.fullmatch(part)
         if not match:
             raise ParseError(f"Invalid fragile site format: '{part}'")
 
@@ -560,18 +618,18 @@ class KaryotypeParser:
             type="fra",
             chromosome=chromosome,
             breakpoints=[breakpoint],
-            inheritance=None,
-            uncertain=False,
+            inheritance=inheritance,
+            uncertain=uncertain,
             copy_count=None,
-            raw=part
+            raw=raw
         )
 
-    def _parse_robertsonian(self, part: str) -> Abnormality:
+    def _parse_robertsonian(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse a Robertsonian translocation.
 
         Format: rob(13;14)(q10;q10) - Robertsonian translocation between chr 13 and 14
         """
-        match = self.ROBERTSONIAN_PATTERN.match(part)
+        match = self.ROBERTSONIAN_PATTERN.fullmatch(part)
         if not match:
             raise ParseError(f"Invalid Robertsonian translocation format: '{part}'")
 
@@ -586,18 +644,18 @@ class KaryotypeParser:
             type="rob",
             chromosome=chromosomes_str,
             breakpoints=breakpoints,
-            inheritance=None,
-            uncertain=False,
+            inheritance=inheritance,
+            uncertain=uncertain,
             copy_count=None,
-            raw=part
+            raw=raw
         )
 
-    def _parse_quadruplication(self, part: str) -> Abnormality:
+    def _parse_quadruplication(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
         """Parse a quadruplication abnormality.
 
         Format: qdp(1)(q21q32) - quadruplication of segment q21 to q32 on chr 1
         """
-        match = self.QUADRUPLICATION_PATTERN.match(part)
+        match = self.QUADRUPLICATION_PATTERN.fullmatch(part)
         if not match:
             raise ParseError(f"Invalid quadruplication format: '{part}'")
 
@@ -605,11 +663,12 @@ class KaryotypeParser:
         breakpoint_str = match.group(2)
 
         # Parse two breakpoints (segment boundaries)
-        breakpoints = []
-        double_bp = re.match(r'^([pq]\d+(?:\.\d+)?)([pq]\d+(?:\.\d+)?)$', breakpoint_str)
+        double_bp = self.DOUBLE_BREAKPOINT_PATTERN.fullmatch(breakpoint_str)
         if double_bp:
-            breakpoints.append(self._parse_breakpoint(double_bp.group(1)))
-            breakpoints.append(self._parse_breakpoint(double_bp.group(2)))
+            breakpoints = [
+                self._parse_breakpoint(double_bp.group(1)),
+                self._parse_breakpoint(double_bp.group(2)),
+            ]
         else:
             raise ParseError(f"Quadruplication requires two breakpoints: '{part}'")
 
@@ -617,380 +676,345 @@ class KaryotypeParser:
             type="qdp",
             chromosome=chromosome,
             breakpoints=breakpoints,
-            inheritance=None,
-            uncertain=False,
+            inheritance=inheritance,
+            uncertain=uncertain,
             copy_count=None,
-            raw=part
+            raw=raw
         )
 
-    def _parse_abnormalities(self, parts: list[str]) -> list[Abnormality]:
-        """Parse abnormality parts."""
-        abnormalities = []
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
-
-            # Check for uncertainty marker (?)
-            uncertain = False
-            original_part = part
-            if part.startswith('?'):
-                uncertain = True
-                part = part[1:]  # Remove the ? prefix
-
-            # Check for inheritance notation (mat, pat, dn) at end
-            inheritance = None
-            if part.endswith('mat'):
-                inheritance = 'mat'
-                part = part[:-3]
-            elif part.endswith('pat'):
-                inheritance = 'pat'
-                part = part[:-3]
-            elif part.endswith('dn'):
-                inheritance = 'dn'
-                part = part[:-2]
-
-            # Try numerical abnormality (+21, -7, +X, -Y)
-            num_match = self.NUMERICAL_ABNORMALITY_PATTERN.match(part)
-            if num_match:
-                abnormalities.append(Abnormality(
-                    type=num_match.group(1),  # "+" or "-"
-                    chromosome=num_match.group(2),
-                    breakpoints=[],
-                    inheritance=inheritance,
-                    uncertain=uncertain,
-                    copy_count=None,
-                    raw=original_part
-                ))
-                continue
-
-            # Try deletion
-            if part.startswith('del('):
-                abn = self._parse_deletion(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
-
-            # Try additional material
-            if part.startswith('add('):
-                abn = self._parse_add(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
-
-            # Try duplication
-            if part.startswith('dup('):
-                abn = self._parse_duplication(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
-
-            # Try dicentric (must check before derivative since both start with 'd')
-            if part.startswith('dic('):
-                abn = self._parse_dicentric(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
-
-            # Try isodicentric (must check before isochromosome since both start with 'i')
-            if part.startswith('idic('):
-                abn = self._parse_isodicentric(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
-
-            # Try fragile site
-            if part.startswith('fra('):
-                abn = self._parse_fragile_site(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
-
-            # Try inversion
-            if part.startswith('inv('):
-                abn = self._parse_inversion(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
-
-            # Try triplication (must check before translocation since both start with 't')
-            if part.startswith('trp('):
-                abn = self._parse_triplication(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
-
-            # Try quadruplication
-            if part.startswith('qdp('):
-                abn = self._parse_quadruplication(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
-
-            # Try translocation
-            if part.startswith('t('):
-                abn = self._parse_translocation(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
+    def _parse_numerical(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
+        """Parse a numerical abnormality (+21, -7, +X, -Y)."""
+        return Abnormality(
+            type=part[0],  # "+" or "-"
+            chromosome=part[1:],
+            breakpoints=[],
+            inheritance=inheritance,
+            uncertain=uncertain,
+            copy_count=None,
+            raw=raw
+        )
 
-            # Try insertion (must check before isochromosome since both start with 'i')
-            if part.startswith('ins('):
-                abn = self._parse_insertion(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
+    def _parse_marker(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
+        """Parse a marker chromosome (+mar, +2mar, +mar1)."""
+        mar_match = self.MARKER_PATTERN.fullmatch(part)
+        count_prefix = mar_match.group(1)  # e.g., "2" in +2mar
+        marker_suffix = mar_match.group(2)  # e.g., "1" in +mar1
+        return Abnormality(
+            type="+mar",
+            chromosome="mar" + marker_suffix if marker_suffix else "mar",
+            breakpoints=[],
+            inheritance=inheritance,
+            uncertain=uncertain,
+            copy_count=int(count_prefix) if count_prefix else None,
+            raw=raw
+        )
 
-            # Try isochromosome
-            if part.startswith('i('):
-                abn = self._parse_isochromosome(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
+    def _parse_derivative(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Optional[Abnormality]:
+        """Parse a derivative chromosome (der(22)t(9;22)(...)).
 
-            # Try Robertsonian translocation (must check before ring since both start with 'r')
-            if part.startswith('rob('):
-                abn = self._parse_robertsonian(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
+        The rearrangement description is captured in raw for now.
+        """
+        der_match = self.DERIVATIVE_PATTERN.fullmatch(part)
+        if not der_match:
+            return None
+        return Abnormality(
+            type="der",
+            chromosome=der_match.group(1),
+            breakpoints=[],
+            inheritance=inheritance,
+            uncertain=uncertain,
+            copy_count=None,
+            raw=raw
+        )
 
-            # Try ring chromosome
-            if part.startswith('r('):
-                abn = self._parse_ring(part)
-                abn.uncertain = uncertain
-                abn.inheritance = inheritance
-                abn.raw = original_part
-                abnormalities.append(abn)
-                continue
+    def _parse_double_minutes(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
+        """Parse double minutes (dmin)."""
+        return Abnormality(
+            type="dmin",
+            chromosome="",
+            breakpoints=[],
+            inheritance=inheritance,
+            uncertain=uncertain,
+            copy_count=None,
+            raw=raw
+        )
 
-            # Try marker chromosome (+mar, +2mar, +mar1)
-            mar_match = self.MARKER_PATTERN.match(part)
-            if mar_match:
-                count_prefix = mar_match.group(1)  # e.g., "2" in +2mar
-                marker_suffix = mar_match.group(2)  # e.g., "1" in +mar1
-                copy_count = int(count_prefix) if count_prefix else None
-                chromosome = "mar" + marker_suffix if marker_suffix else "mar"
-                abnormalities.append(Abnormality(
-                    type="+mar",
-                    chromosome=chromosome,
-                    breakpoints=[],
-                    inheritance=inheritance,
-                    uncertain=uncertain,
-                    copy_count=copy_count,
-                    raw=original_part
-                ))
-                continue
+    def _parse_hsr(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Optional[Abnormality]:
+        """Parse a homogeneously staining region (hsr or hsr(1)(p22))."""
+        if part == 'hsr':
+            return Abnormality(
+                type="hsr",
+                chromosome="",
+                breakpoints=[],
+                inheritance=inheritance,
+                uncertain=uncertain,
+                copy_count=None,
+                raw=raw
+            )
+        hsr_loc_match = self.HSR_LOCATION_PATTERN.fullmatch(part)
+        if not hsr_loc_match:
+            return None
+        return Abnormality(
+            type="hsr",
+            chromosome=hsr_loc_match.group(1),
+            breakpoints=[self._parse_breakpoint(hsr_loc_match.group(2))],
+            inheritance=inheritance,
+            uncertain=uncertain,
+            copy_count=None,
+            raw=raw
+        )
 
-            # Try derivative chromosome (der(22)t(9;22)(...))
-            der_match = self.DERIVATIVE_PATTERN.match(part)
-            if der_match:
-                chromosome = der_match.group(1)
-                # The rearrangement description is captured in raw for now
-                abnormalities.append(Abnormality(
-                    type="der",
-                    chromosome=chromosome,
-                    breakpoints=[],
-                    inheritance=inheritance,
-                    uncertain=uncertain,
-                    copy_count=None,
-                    raw=original_part
-                ))
-                continue
+    def _parse_pseudodicentric(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Optional[Abnormality]:
+        """Parse a pseudodicentric (psu dic(13;14)(q14;q11))."""
+        psu_match = self.PSEUDODICENTRIC_PATTERN.fullmatch(part)
+        if not psu_match:
+            return None
+        return Abnormality(
+            type="psu dic",
+            chromosome=psu_match.group(1),
+            breakpoints=self._parse_multiple_breakpoints(psu_match.group(2)),
+            inheritance=inheritance,
+            uncertain=uncertain,
+            copy_count=None,
+            raw=raw
+        )
 
-            # Try double minutes (dmin)
-            if self.DMIN_PATTERN.match(part):
-                abnormalities.append(Abnormality(
-                    type="dmin",
-                    chromosome="",
-                    breakpoints=[],
-                    inheritance=inheritance,
-                    uncertain=uncertain,
-                    copy_count=None,
-                    raw=original_part
-                ))
-                continue
+    def _parse_acentric(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Optional[Abnormality]:
+        """Parse an acentric fragment (ace(1)(q21q31))."""
+        ace_match = self.ACENTRIC_PATTERN.fullmatch(part)
+        if not ace_match:
+            return None
+        return Abnormality(
+            type="ace",
+            chromosome=ace_match.group(1),
+            breakpoints=self._parse_breakpoints(ace_match.group(2)),
+            inheritance=inheritance,
+            uncertain=uncertain,
+            copy_count=None,
+            raw=raw
+        )
 
-            # Try HSR with location (hsr(1)(p22))
-            hsr_loc_match = self.HSR_LOCATION_PATTERN.match(part)
-            if hsr_loc_match:
-                chromosome = hsr_loc_match.group(1)
-                breakpoint_str = hsr_loc_match.group(2)
-                breakpoint = self._parse_breakpoint(breakpoint_str)
-                abnormalities.append(Abnormality(
-                    type="hsr",
-                    chromosome=chromosome,
-                    breakpoints=[breakpoint],
-                    inheritance=inheritance,
-                    uncertain=uncertain,
-                    copy_count=None,
-                    raw=original_part
-                ))
-                continue
+    def _parse_telomeric_association(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Optional[Abnormality]:
+        """Parse a telomeric association (tas(13;14)(p11;p11))."""
+        tas_match = self.TELOMERIC_ASSOC_PATTERN.fullmatch(part)
+        if not tas_match:
+            return None
+        return Abnormality(
+            type="tas",
+            chromosome=tas_match.group(1),
+            breakpoints=self._parse_multiple_breakpoints(tas_match.group(2)),
+            inheritance=inheritance,
+            uncertain=uncertain,
+            copy_count=None,
+            raw=raw
+        )
 
-            # Try simple HSR (hsr)
-            if self.HSR_SIMPLE_PATTERN.match(part):
-                abnormalities.append(Abnormality(
-                    type="hsr",
-                    chromosome="",
-                    breakpoints=[],
-                    inheritance=inheritance,
-                    uncertain=uncertain,
-                    copy_count=None,
-                    raw=original_part
-                ))
-                continue
+    def _parse_fission(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Optional[Abnormality]:
+        """Parse a fission (fis(1)(p10))."""
+        fis_match = self.FISSION_PATTERN.fullmatch(part)
+        if not fis_match:
+            return None
+        return Abnormality(
+            type="fis",
+            chromosome=fis_match.group(1),
+            breakpoints=[self._parse_breakpoint(fis_match.group(2))],
+            inheritance=inheritance,
+            uncertain=uncertain,
+            copy_count=None,
+            raw=raw
+        )
 
-            # Try pseudodicentric (psu dic(...))
-            psu_match = self.PSEUDODICENTRIC_PATTERN.match(part)
-            if psu_match:
-                chromosomes = psu_match.group(1)
-                breakpoint_str = psu_match.group(2)
-                breakpoints = self._parse_multiple_breakpoints(breakpoint_str)
-                abnormalities.append(Abnormality(
-                    type="psu dic",
-                    chromosome=chromosomes,
-                    breakpoints=breakpoints,
-                    inheritance=inheritance,
-                    uncertain=uncertain,
-                    copy_count=None,
-                    raw=original_part
-                ))
-                continue
+    def _parse_neocentromere(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Optional[Abnormality]:
+        """Parse a neocentromere (neo(1)(q21))."""
+        neo_match = self.NEOCENTROMERE_PATTERN.fullmatch(part)
+        if not neo_match:
+            return None
+        return Abnormality(
+            type="neo",
+            chromosome=neo_match.group(1),
+            breakpoints=[self._parse_breakpoint(neo_match.group(2))],
+            inheritance=inheritance,
+            uncertain=uncertain,
+            copy_count=None,
+            raw=raw
+        )
 
-            # Try acentric fragment
-            ace_match = self.ACENTRIC_PATTERN.match(part)
-            if ace_match:
-                chromosome = ace_match.group(1)
-                breakpoint_str = ace_match.group(2)
-                breakpoints = self._parse_breakpoints(breakpoint_str)
-                abnormalities.append(Abnormality(
-                    type="ace",
-                    chromosome=chromosome,
-                    breakpoints=breakpoints,
-                    inheritance=inheritance,
-                    uncertain=uncertain,
-                    copy_count=None,
-                    raw=original_part
-                ))
-                continue
+    def _parse_incomplete(self, part: str, uncertain: bool, inheritance: Optional[str], raw: str) -> Abnormality:
+        """Parse the incomplete karyotype marker (inc)."""
+        return Abnormality(
+            type="inc",
+            chromosome="",
+            breakpoints=[],
+            inheritance=inheritance,
+            uncertain=uncertain,
+            copy_count=None,
+            raw=raw
+        )
 
-            # Try telomeric association
-            tas_match = self.TELOMERIC_ASSOC_PATTERN.match(part)
-            if tas_match:
-                chromosomes = tas_match.group(1)
-                breakpoint_str = tas_match.group(2)
-                breakpoints = self._parse_multiple_breakpoints(breakpoint_str)
-                abnormalities.append(Abnormality(
-                    type="tas",
-                    chromosome=chromosomes,
-                    breakpoints=breakpoints,
-                    inheritance=inheritance,
-                    uncertain=uncertain,
-                    copy_count=None,
-                    raw=original_part
-                ))
+    # Keyword before the first "(" -> parse method. Looking up the whole
+    # keyword means shorter prefixes (i, r, t) cannot shadow longer ones
+    # (idic, ins, rob, trp).
+    #
+    # Each parser gets the part with any "?" prefix and inheritance suffix
+    # stripped, plus those values and the original text so the Abnormality
+    # is built in its final state. Strict parsers raise ParseError on
+    # malformed input; the others return None and the part is recorded as
+    # type "unknown".
+    _KEYWORD_PARSERS = {
+        # strict
+        'del': _parse_deletion,
+        'add': _parse_add,
+        'dup': _parse_duplication,
+        'dic': _parse_dicentric,
+        'idic': _parse_isodicentric,
+        'fra': _parse_fragile_site,
+        'inv': _parse_inversion,
+        'trp': _parse_triplication,
+        'qdp': _parse_quadruplication,
+        't': _parse_translocation,
+        'ins': _parse_insertion,
+        'i': _parse_isochromosome,
+        'rob': _parse_robertsonian,
+        'r': _parse_ring,
+        # lenient
+        'hsr': _parse_hsr,
+        'der': _parse_derivative,
+        'ace': _parse_acentric,
+        'tas': _parse_telomeric_association,
+        'fis': _parse_fission,
+        'neo': _parse_neocentromere,
+    }
+
+    # Whole part -> parse method, for the forms written without a keyword.
+    # Numerical abnormalities are a closed set (a sign plus one or two
+    # digits, X or Y), so they are enumerated here rather than matched.
+    _LITERAL_PARSERS = {
+        'dmin': _parse_double_minutes,
+        'hsr': _parse_hsr,
+        'inc': _parse_incomplete,
+        '+mar': _parse_marker,
+    }
+    for _chromosome in [*'0123456789XY', *(f'{n:02d}' for n in range(100))]:
+        _LITERAL_PARSERS['+' + _chromosome] = _parse_numerical
+        _LITERAL_PARSERS['-' + _chromosome] = _parse_numerical
+    del _chromosome
+
+    # ABNORMALITY_DISPATCH_PATTERN group -> parse method
+    _ABNORMALITY_PARSERS = {
+        'marker': _parse_marker,
+        'psu_dic': _parse_pseudodicentric,
+    }
+
+    def _parse_abnormalities(self, abnormalities_str: str) -> list[Abnormality]:
+        """Parse the comma-separated abnormality tail of a karyotype."""
+        # Runs once per abnormality: bind the tables and bound methods once
+        keyword_parsers = self._KEYWORD_PARSERS
+        literal_parsers = self._LITERAL_PARSERS
+        pattern_parsers = self._ABNORMALITY_PARSERS
+        dispatch_match = self.ABNORMALITY_DISPATCH_PATTERN.match
+        abnormalities = []
+        append = abnormalities.append
+        for part in abnormalities_str.split(','):
+            part = part.strip()
+            if not part:
                 continue
 
-            # Try fission
-            fis_match = self.FISSION_PATTERN.match(part)
-            if fis_match:
-                chromosome = fis_match.group(1)
-                breakpoint_str = fis_match.group(2)
-                breakpoint = self._parse_breakpoint(breakpoint_str)
-                abnormalities.append(Abnormality(
-                    type="fis",
-                    chromosome=chromosome,
-                    breakpoints=[breakpoint],
-                    inheritance=inheritance,
-                    uncertain=uncertain,
-                    copy_count=None,
-                    raw=original_part
-                ))
-                continue
+            # Check for uncertainty marker (?)
+            uncertain = False
+            original_part = part
+            if part.startswith('?'):
+                uncertain = True
+                part = part[1:]  # Remove the ? prefix
 
-            # Try neocentromere
-            neo_match = self.NEOCENTROMERE_PATTERN.match(part)
-            if neo_match:
-                chromosome = neo_match.group(1)
-                breakpoint_str = neo_match.group(2)
-                breakpoint = self._parse_breakpoint(breakpoint_str)
-                abnormalities.append(Abnormality(
-                    type="neo",
-                    chromosome=chromosome,
-                    breakpoints=[breakpoint],
-                    inheritance=inheritance,
-                    uncertain=uncertain,
-                    copy_count=None,
-                    raw=original_part
-                ))
-                continue
+            # Check for inheritance notation (mat, pat, dn) at end; most
+            # parts end in ')', so test the last character first
+            inheritance = None
+            last = part[-1:]
+            if last == 't':
+                if part.endswith('mat'):
+                    inheritance = 'mat'
+                    part = part[:-3]
+                elif part.endswith('pat'):
+                    inheritance = 'pat'
+                    part = part[:-3]
+            elif last == 'n' and part.endswith('dn'):
+                inheritance = 'dn'
+                part = part[:-2]
 
-            # Try incomplete karyotype
-            if self.INCOMPLETE_PATTERN.match(part):
-                abnormalities.append(Abnormality(
-                    type="inc",
+            # Most forms are a whole token (+21, -7, dmin) or keyword(...):
+            # look them up directly, whole tokens first since aneuploidies are
+            # the most common part, and only fall back to the dispatch
+            # pattern for the rest
+            abn = None
+            try:
+                if not part.isascii():
+                    # The patterns match ASCII only; reject here so that, for
+                    # example, full-width digits fail the same way in every
+                    # form instead of some parts falling through to "unknown"
+                    raise ParseError(
+                        f"Invalid chromosome in '{original_part}': only ASCII characters are allowed"
+                    )
+                direct_parser = literal_parsers.get(part)
+                if direct_parser is None:
+                    paren = part.find('(')
+                    if paren > 0:
+                        direct_parser = keyword_parsers.get(part[:paren])
+                if direct_parser is not None:
+                    abn = direct_parser(self, part, uncertain, inheritance, original_part)
+                else:
+                    dispatch = dispatch_match(part)
+                    if dispatch:
+                        abn = pattern_parsers[dispatch.lastgroup](
+                            self, part, uncertain, inheritance, original_part
+                        )
+            except ParseError:
+                if self.strict:
+                    raise
+
+            if abn is None:
+                # Unknown abnormality type, or unparseable in non-strict mode
+                abn = Abnormality(
+                    type="unknown",
                     chromosome="",
                     breakpoints=[],
                     inheritance=inheritance,
                     uncertain=uncertain,
                     copy_count=None,
                     raw=original_part
-                ))
-                continue
+                )
 
-            # Unknown abnormality type (will be expanded in later tasks)
-            abnormalities.append(Abnormality(
-                type="unknown",
-                chromosome="",
-                breakpoints=[],
-                inheritance=inheritance,
-                uncertain=uncertain,
-                copy_count=None,
-                raw=original_part
-            ))
+            append(abn)
         return abnormalities
 
     def _parse_breakpoints(self, bp_str: str) -> list[Breakpoint]:
         """Parse one or two concatenated breakpoints like 'q21' or 'q21q31'."""
-        breakpoints = []
         # Try to match two breakpoints
-        double_bp = re.match(r'^([pq]\d+(?:\.\d+)?)([pq]\d+(?:\.\d+)?)$', bp_str)
+        double_bp = self.DOUBLE_BREAKPOINT_PATTERN.fullmatch(bp_str)
         if double_bp:
-            breakpoints.append(self._parse_breakpoint(double_bp.group(1)))
-            breakpoints.append(self._parse_breakpoint(double_bp.group(2)))
-        else:
-            # Single breakpoint
-            breakpoints.append(self._parse_breakpoint(bp_str))
-        return breakpoints
+            return [
+                self._parse_breakpoint(double_bp.group(1)),
+                self._parse_breakpoint(double_bp.group(2)),
+            ]
+        # Single breakpoint
+        return [self._parse_breakpoint(bp_str)]
 
     def _parse_multiple_breakpoints(self, bp_str: str) -> list[Breakpoint]:
         """Parse semicolon-separated breakpoints like 'p11;p11'."""
         bp_parts = bp_str.split(';')
         return [self._parse_breakpoint(bp.strip()) for bp in bp_parts]
+
+
+_default_parser = KaryotypeParser()
+
+
+@lru_cache(maxsize=4096)
+def parse(karyotype: str) -> KaryotypeAST:
+    """Parse a karyotype string with a shared parser, memoizing the result.
+
+    The parser holds no per-call state, so one instance serves every
+    caller, and recurring strings ("46,XX", "47,XY,+21") become a cache
+    hit. The returned AST is shared between callers and must be treated
+    as read-only; use KaryotypeParser().parse() for a private copy.
+    ParseError is raised on every call for invalid input.
+    """
+    return _default_parser.parse(karyotype)
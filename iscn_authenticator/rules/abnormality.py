@@ -1,11 +1,12 @@
 # iscn_authenticator/rules/abnormality.py
 """Validation rules for karyotype abnormalities."""
+from typing import Optional
 from iscn_authenticator.rules.base import Rule
 from iscn_authenticator.models import KaryotypeAST, Abnormality
 
 
 # Valid autosome numbers (1-22) and sex chromosomes (X, Y)
-VALID_CHROMOSOMES = {str(i) for i in range(1, 23)} | {"X", "Y"}
+VALID_CHROMOSOMES = frozenset([*(str(i) for i in range(1, 23)), "X", "Y"])
 
 
 def _validate_numerical_chromosome(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
@@ -50,8 +51,7 @@ def _validate_translocation_breakpoint_count(ast: KaryotypeAST, abnormality: Abn
         return []
 
     # Count chromosomes from the chromosome field (semicolon-separated)
-    chromosomes = abnormality.chromosome.split(";")
-    chr_count = len(chromosomes)
+    chr_count = abnormality.chromosome.count(";") + 1
     bp_count = len(abnormality.breakpoints)
 
     if chr_count != bp_count:
@@ -61,54 +61,73 @@ def _validate_translocation_breakpoint_count(ast: KaryotypeAST, abnormality: Abn
     return []
 
 
-def _validate_deletion_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
-    """Validate deletion breakpoints.
+def _same_arm_breakpoints_validator(
+    abnormality_type: str,
+    label: str,
+    allowed_counts: tuple[int, ...],
+    arm_label: Optional[str] = None,
+):
+    """Build a validator for a type whose two breakpoints must share an arm.
 
-    - Terminal deletion: 1 breakpoint
-    - Interstitial deletion: 2 breakpoints on same arm
+    label names the abnormality in the error messages; arm_label, when
+    given, replaces it in the same-arm message.
     """
-    if abnormality.type != "del":
-        return []
-
-    bp_count = len(abnormality.breakpoints)
+    required = " or ".join(("one", "two")[count - 1] for count in allowed_counts)
+    arm_label = arm_label or label
+
+    def validate(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
+        if abnormality.type != abnormality_type:
+            return []
+
+        breakpoints = abnormality.breakpoints
+        bp_count = len(breakpoints)
+        if bp_count not in allowed_counts:
+            return [f"{label} requires {required} breakpoints, found {bp_count} in {abnormality.raw}"]
+
+        # If 2 breakpoints, they must be on the same arm
+        if bp_count == 2:
+            arm1 = breakpoints[0].arm
+            arm2 = breakpoints[1].arm
+            if arm1 != arm2:
+                return [
+                    f"{arm_label} breakpoints must be on same arm, found {arm1} and {arm2} in {abnormality.raw}"
+                ]
 
-    # Must have 1 or 2 breakpoints
-    if bp_count not in (1, 2):
-        return [f"Deletion requires one or two breakpoints, found {bp_count} in {abnormality.raw}"]
+        return []
 
-    # If 2 breakpoints, they must be on the same arm
-    if bp_count == 2:
-        arm1 = abnormality.breakpoints[0].arm
-        arm2 = abnormality.breakpoints[1].arm
-        if arm1 != arm2:
-            return [f"Interstitial deletion breakpoints must be on same arm, found {arm1} and {arm2} in {abnormality.raw}"]
+    return validate
 
-    return []
 
+def _matching_breakpoints_validator(abnormality_type: str, label: str):
+    """Build a validator for a type with one breakpoint per chromosome.
 
-def _validate_duplication_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
-    """Validate duplication breakpoints.
-
-    - Tandem duplication: 1 breakpoint
-    - Interstitial duplication: 2 breakpoints on same arm
+    label names the abnormality in the error message.
     """
-    if abnormality.type != "dup":
+    def validate(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
+        if abnormality.type != abnormality_type:
+            return []
+
+        # Count chromosomes from the chromosome field (semicolon-separated)
+        chr_count = abnormality.chromosome.count(";") + 1
+        bp_count = len(abnormality.breakpoints)
+
+        if chr_count != bp_count:
+            return [
+                f"{label} has {chr_count} chromosomes but {bp_count} breakpoints in {abnormality.raw}"
+            ]
         return []
 
-    bp_count = len(abnormality.breakpoints)
+    return validate
 
-    # Must have 1 or 2 breakpoints
-    if bp_count not in (1, 2):
-        return [f"Duplication requires one or two breakpoints, found {bp_count} in {abnormality.raw}"]
 
-    # If 2 breakpoints, they must be on the same arm
-    if bp_count == 2:
-        arm1 = abnormality.breakpoints[0].arm
-        arm2 = abnormality.breakpoints[1].arm
-        if arm1 != arm2:
-            return [f"Duplication breakpoints must be on same arm, found {arm1} and {arm2} in {abnormality.raw}"]
+# Deletion: terminal has 1 breakpoint, interstitial 2 on the same arm
+_validate_deletion_breakpoints = _same_arm_breakpoints_validator(
+    "del", "Deletion", (1, 2), arm_label="Interstitial deletion"
+)
 
-    return []
+
+# Duplication: tandem has 1 breakpoint, interstitial 2 on the same arm
+_validate_duplication_breakpoints = _same_arm_breakpoints_validator("dup", "Duplication", (1, 2))
 
 
 def _validate_ring_chromosome_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
@@ -151,70 +170,16 @@ def _validate_isochromosome_breakpoints(ast: KaryotypeAST, abnormality: Abnormal
     return []
 
 
-def _validate_triplication_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
-    """Validate triplication breakpoints.
-
-    Triplications have exactly 2 breakpoints on the same arm.
-    """
-    if abnormality.type != "trp":
-        return []
-
-    bp_count = len(abnormality.breakpoints)
-
-    # Must have exactly 2 breakpoints
-    if bp_count != 2:
-        return [f"Triplication requires two breakpoints, found {bp_count} in {abnormality.raw}"]
-
-    # Breakpoints must be on the same arm
-    arm1 = abnormality.breakpoints[0].arm
-    arm2 = abnormality.breakpoints[1].arm
-    if arm1 != arm2:
-        return [f"Triplication breakpoints must be on same arm, found {arm1} and {arm2} in {abnormality.raw}"]
-
-    return []
-
-
-def _validate_quadruplication_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
-    """Validate quadruplication breakpoints.
-
-    Quadruplications have exactly 2 breakpoints on the same arm.
-    """
-    if abnormality.type != "qdp":
-        return []
-
-    bp_count = len(abnormality.breakpoints)
-
-    # Must have exactly 2 breakpoints
-    if bp_count != 2:
-        return [f"Quadruplication requires two breakpoints, found {bp_count} in {abnormality.raw}"]
-
-    # Breakpoints must be on the same arm
-    arm1 = abnormality.breakpoints[0].arm
-    arm2 = abnormality.breakpoints[1].arm
-    if arm1 != arm2:
-        return [f"Quadruplication breakpoints must be on same arm, found {arm1} and {arm2} in {abnormality.raw}"]
-
-    return []
-
+# Triplication: exactly 2 breakpoints on the same arm
+_validate_triplication_breakpoints = _same_arm_breakpoints_validator("trp", "Triplication", (2,))
 
-def _validate_dicentric_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
-    """Validate dicentric chromosome breakpoints.
 
-    Dicentric chromosomes have breakpoint count matching chromosome count.
-    """
-    if abnormality.type != "dic":
-        return []
+# Quadruplication: exactly 2 breakpoints on the same arm
+_validate_quadruplication_breakpoints = _same_arm_breakpoints_validator("qdp", "Quadruplication", (2,))
 
-    # Count chromosomes from the chromosome field (semicolon-separated)
-    chromosomes = abnormality.chromosome.split(";")
-    chr_count = len(chromosomes)
-    bp_count = len(abnormality.breakpoints)
 
-    if chr_count != bp_count:
-        return [
-            f"Dicentric has {chr_count} chromosomes but {bp_count} breakpoints in {abnormality.raw}"
-        ]
-    return []
+# Dicentric: one breakpoint per chromosome
+_validate_dicentric_breakpoints = _matching_breakpoints_validator("dic", "Dicentric")
 
 
 def _validate_isodicentric_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
@@ -234,24 +199,8 @@ def _validate_isodicentric_breakpoints(ast: KaryotypeAST, abnormality: Abnormali
     return []
 
 
-def _validate_robertsonian_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
-    """Validate Robertsonian translocation breakpoints.
-
-    Robertsonian translocations have breakpoint count matching chromosome count.
-    """
-    if abnormality.type != "rob":
-        return []
-
-    # Count chromosomes from the chromosome field (semicolon-separated)
-    chromosomes = abnormality.chromosome.split(";")
-    chr_count = len(chromosomes)
-    bp_count = len(abnormality.breakpoints)
-
-    if chr_count != bp_count:
-        return [
-            f"Robertsonian translocation has {chr_count} chromosomes but {bp_count} breakpoints in {abnormality.raw}"
-        ]
-    return []
+# Robertsonian translocation: one breakpoint per chromosome
+_validate_robertsonian_breakpoints = _matching_breakpoints_validator("rob", "Robertsonian translocation")
 
 
 def _validate_add_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
@@ -352,24 +301,8 @@ def _validate_mar_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> li
     return []
 
 
-def _validate_pseudodicentric_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
-    """Validate pseudodicentric (psu dic) breakpoints.
-
-    Pseudodicentric chromosomes have breakpoint count matching chromosome count.
-    """
-    if abnormality.type != "psu dic":
-        return []
-
-    # Count chromosomes from the chromosome field (semicolon-separated)
-    chromosomes = abnormality.chromosome.split(";")
-    chr_count = len(chromosomes)
-    bp_count = len(abnormality.breakpoints)
-
-    if chr_count != bp_count:
-        return [
-            f"Pseudodicentric has {chr_count} chromosomes but {bp_count} breakpoints in {abnormality.raw}"
-        ]
-    return []
+# Pseudodicentric: one breakpoint per chromosome
+_validate_pseudodicentric_breakpoints = _matching_breakpoints_validator("psu dic", "Pseudodicentric")
 
 
 def _validate_acentric_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
@@ -388,24 +321,8 @@ def _validate_acentric_breakpoints(ast: KaryotypeAST, abnormality: Abnormality)
     return []
 
 
-def _validate_telomeric_association_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
-    """Validate telomeric association (tas) breakpoints.
-
-    Telomeric associations have breakpoint count matching chromosome count.
-    """
-    if abnormality.type != "tas":
-        return []
-
-    # Count chromosomes from the chromosome field (semicolon-separated)
-    chromosomes = abnormality.chromosome.split(";")
-    chr_count = len(chromosomes)
-    bp_count = len(abnormality.breakpoints)
-
-    if chr_count != bp_count:
-        return [
-            f"Telomeric association has {chr_count} chromosomes but {bp_count} breakpoints in {abnormality.raw}"
-        ]
-    return []
+# Telomeric association: one breakpoint per chromosome
+_validate_telomeric_association_breakpoints = _matching_breakpoints_validator("tas", "Telomeric association")
 
 
 def _validate_fission_breakpoints(ast: KaryotypeAST, abnormality: Abnormality) -> list[str]:
@@ -461,175 +378,199 @@ numerical_chromosome_valid_rule = Rule(
     id="ABN_NUM_CHR_VALID",
     category="abnormality",
     description="Numerical abnormality chromosome must be 1-22, X, or Y",
-    validate=_validate_numerical_chromosome
+    validate=_validate_numerical_chromosome,
+    applicable_types=frozenset({"+", "-"}),
 )
 
 breakpoint_arm_valid_rule = Rule(
     id="ABN_BP_ARM_VALID",
     category="abnormality",
     description="Breakpoint arm must be 'p' or 'q'",
-    validate=_validate_breakpoint_arm
+    validate=_validate_breakpoint_arm,
 )
 
 inversion_two_breakpoints_rule = Rule(
     id="ABN_INV_TWO_BP",
     category="abnormality",
     description="Inversion must have exactly two breakpoints",
-    validate=_validate_inversion_two_breakpoints
+    validate=_validate_inversion_two_breakpoints,
+    applicable_types=frozenset({"inv"}),
 )
 
 translocation_breakpoint_count_rule = Rule(
     id="ABN_TRANS_BP_COUNT",
     category="abnormality",
     description="Translocation breakpoint count must match chromosome count",
-    validate=_validate_translocation_breakpoint_count
+    validate=_validate_translocation_breakpoint_count,
+    applicable_types=frozenset({"t"}),
 )
 
 deletion_breakpoint_rule = Rule(
     id="ABN_DEL_BP",
     category="abnormality",
     description="Deletion must have 1-2 breakpoints, interstitial requires same arm",
-    validate=_validate_deletion_breakpoints
+    validate=_validate_deletion_breakpoints,
+    applicable_types=frozenset({"del"}),
 )
 
 duplication_breakpoint_rule = Rule(
     id="ABN_DUP_BP",
     category="abnormality",
     description="Duplication must have 1-2 breakpoints, interstitial requires same arm",
-    validate=_validate_duplication_breakpoints
+    validate=_validate_duplication_breakpoints,
+    applicable_types=frozenset({"dup"}),
 )
 
 ring_chromosome_breakpoint_rule = Rule(
     id="ABN_RING_BP",
     category="abnormality",
     description="Ring chromosome must have 2 breakpoints on different arms",
-    validate=_validate_ring_chromosome_breakpoints
+    validate=_validate_ring_chromosome_breakpoints,
+    applicable_types=frozenset({"r"}),
 )
 
 isochromosome_breakpoint_rule = Rule(
     id="ABN_ISO_BP",
     category="abnormality",
     description="Isochromosome must have exactly 1 breakpoint",
-    validate=_validate_isochromosome_breakpoints
+    validate=_validate_isochromosome_breakpoints,
+    applicable_types=frozenset({"i"}),
 )
 
 triplication_breakpoint_rule = Rule(
     id="ABN_TRP_BP",
     category="abnormality",
     description="Triplication must have 2 breakpoints on same arm",
-    validate=_validate_triplication_breakpoints
+    validate=_validate_triplication_breakpoints,
+    applicable_types=frozenset({"trp"}),
 )
 
 quadruplication_breakpoint_rule = Rule(
     id="ABN_QDP_BP",
     category="abnormality",
     description="Quadruplication must have 2 breakpoints on same arm",
-    validate=_validate_quadruplication_breakpoints
+    validate=_validate_quadruplication_breakpoints,
+    applicable_types=frozenset({"qdp"}),
 )
 
 dicentric_breakpoint_rule = Rule(
     id="ABN_DIC_BP",
     category="abnormality",
     description="Dicentric breakpoint count must match chromosome count",
-    validate=_validate_dicentric_breakpoints
+    validate=_validate_dicentric_breakpoints,
+    applicable_types=frozenset({"dic"}),
 )
 
 isodicentric_breakpoint_rule = Rule(
     id="ABN_IDIC_BP",
     category="abnormality",
     description="Isodicentric must have exactly 1 breakpoint",
-    validate=_validate_isodicentric_breakpoints
+    validate=_validate_isodicentric_breakpoints,
+    applicable_types=frozenset({"idic"}),
 )
 
 robertsonian_breakpoint_rule = Rule(
     id="ABN_ROB_BP",
     category="abnormality",
     description="Robertsonian translocation breakpoint count must match chromosome count",
-    validate=_validate_robertsonian_breakpoints
+    validate=_validate_robertsonian_breakpoints,
+    applicable_types=frozenset({"rob"}),
 )
 
 add_breakpoint_rule = Rule(
     id="ABN_ADD_BP",
     category="abnormality",
     description="Add (additional material) must have exactly 1 breakpoint",
-    validate=_validate_add_breakpoints
+    validate=_validate_add_breakpoints,
+    applicable_types=frozenset({"add"}),
 )
 
 fra_breakpoint_rule = Rule(
     id="ABN_FRA_BP",
     category="abnormality",
     description="Fragile site must have exactly 1 breakpoint",
-    validate=_validate_fra_breakpoints
+    validate=_validate_fra_breakpoints,
+    applicable_types=frozenset({"fra"}),
 )
 
 ins_breakpoint_rule = Rule(
     id="ABN_INS_BP",
     category="abnormality",
     description="Insertion must have exactly 3 breakpoints",
-    validate=_validate_ins_breakpoints
+    validate=_validate_ins_breakpoints,
+    applicable_types=frozenset({"ins"}),
 )
 
 dmin_breakpoint_rule = Rule(
     id="ABN_DMIN_BP",
     category="abnormality",
     description="Double minutes must have no breakpoints",
-    validate=_validate_dmin_breakpoints
+    validate=_validate_dmin_breakpoints,
+    applicable_types=frozenset({"dmin"}),
 )
 
 hsr_breakpoint_rule = Rule(
     id="ABN_HSR_BP",
     category="abnormality",
     description="HSR must have 0 or 1 breakpoint",
-    validate=_validate_hsr_breakpoints
+    validate=_validate_hsr_breakpoints,
+    applicable_types=frozenset({"hsr"}),
 )
 
 mar_breakpoint_rule = Rule(
     id="ABN_MAR_BP",
     category="abnormality",
     description="Marker chromosome must have no breakpoints",
-    validate=_validate_mar_breakpoints
+    validate=_validate_mar_breakpoints,
+    applicable_types=frozenset({"mar"}),
 )
 
 pseudodicentric_breakpoint_rule = Rule(
     id="ABN_PSU_DIC_BP",
     category="abnormality",
     description="Pseudodicentric breakpoint count must match chromosome count",
-    validate=_validate_pseudodicentric_breakpoints
+    validate=_validate_pseudodicentric_breakpoints,
+    applicable_types=frozenset({"psu dic"}),
 )
 
 acentric_breakpoint_rule = Rule(
     id="ABN_ACE_BP",
     category="abnormality",
     description="Acentric fragment must have 1-2 breakpoints",
-    validate=_validate_acentric_breakpoints
+    validate=_validate_acentric_breakpoints,
+    applicable_types=frozenset({"ace"}),
 )
 
 telomeric_association_breakpoint_rule = Rule(
     id="ABN_TAS_BP",
     category="abnormality",
     description="Telomeric association breakpoint count must match chromosome count",
-    validate=_validate_telomeric_association_breakpoints
+    validate=_validate_telomeric_association_breakpoints,
+    applicable_types=frozenset({"tas"}),
 )
 
 fission_breakpoint_rule = Rule(
     id="ABN_FIS_BP",
     category="abnormality",
     description="Fission must have exactly 1 breakpoint",
-    validate=_validate_fission_breakpoints
+    validate=_validate_fission_breakpoints,
+    applicable_types=frozenset({"fis"}),
 )
 
 neocentromere_breakpoint_rule = Rule(
     id="ABN_NEO_BP",
     category="abnormality",
     description="Neocentromere must have exactly 1 breakpoint",
-    validate=_validate_neocentromere_breakpoints
+    validate=_validate_neocentromere_breakpoints,
+    applicable_types=frozenset({"neo"}),
 )
 
 incomplete_breakpoint_rule = Rule(
     id="ABN_INC_BP",
     category="abnormality",
     description="Incomplete karyotype marker must have no breakpoints",
-    validate=_validate_incomplete_breakpoints
+    validate=_validate_incomplete_breakpoints,
+    applicable_types=frozenset({"inc"}),
 )
 
 # Export all rules
@@ -2,10 +2,16 @@ from dataclasses import dataclass
 from typing import Callable, Any, Optional
 from iscn_authenticator.models import KaryotypeAST
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Rule:
-    """A validation rule for karyotype components."""
+    """A validation rule for karyotype components.
+
+    Rules are shared by every engine that registers them, so they are frozen.
+    """
     id: str
     category: str
     description: str
     validate: Callable[[Any, Optional[KaryotypeAST]], list[str]]
+    # Abnormality types the rule applies to; None means every type. Lets the
+    # engine skip rules that cannot fire for a given abnormality.
+    applicable_types: Optional[frozenset[str]] = None
@@ -37,25 +37,24 @@ def _validate_sex_chromosomes_valid(ast: KaryotypeAST, _) -> list[str]:
 
 def _validate_sex_chromosomes_coherence(ast: KaryotypeAST, _) -> list[str]:
     """Validate coherence between chromosome count and sex chromosome count."""
-    count = ast.chromosome_count
     sex = ast.sex_chromosomes
 
-    if isinstance(count, str) or sex == "U":
-        # Skip coherence check for ranges or undisclosed
-        return []
-
-    sex_count = len(sex)
-
     # Basic coherence check for common karyotypes without listed abnormalities.
     # Only enforce strict coherence for 45 and 46 chromosome counts,
     # as these are the most common and well-defined cases.
     # Other counts (47+) often indicate aneuploidy that may not be fully
     # specified in the sex chromosomes alone.
-    if not ast.abnormalities:
-        if count == 46 and sex_count != 2:
-            return [f"Chromosome count 46 requires 2 sex chromosomes, but found {sex_count} ('{sex}')"]
-        if count == 45 and sex_count != 1:
-            return [f"Chromosome count 45 requires 1 sex chromosome, but found {sex_count} ('{sex}')"]
+    # Ranges ("45~48") never equal 45 or 46, so need no separate check.
+    if ast.abnormalities or sex == "U":
+        return []
+
+    count = ast.chromosome_count
+    if count == 46:
+        if len(sex) != 2:
+            return [f"Chromosome count 46 requires 2 sex chromosomes, but found {len(sex)} ('{sex}')"]
+    elif count == 45:
+        if len(sex) != 1:
+            return [f"Chromosome count 45 requires 1 sex chromosome, but found {len(sex)} ('{sex}')"]
 
     return []
 
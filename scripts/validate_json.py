@@ -4,6 +4,7 @@
 Usage:
     python3 scripts/validate_json.py "46,XX"
     echo "46,XX" | python3 scripts/validate_json.py
+    python3 scripts/validate_json.py --batch < karyotypes.txt
 
 Outputs JSON to stdout with structure:
 {
@@ -11,23 +12,32 @@ Outputs JSON to stdout with structure:
     "errors": [...],
     "parsed": {...} or null
 }
+
+With --batch, reads one karyotype per line from stdin and writes one
+compact JSON object per line (NDJSON), in input order. Blank lines are
+skipped. Exits 0 if every karyotype is valid, 1 otherwise.
 """
 import json
 import sys
-from dataclasses import asdict, is_dataclass
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from iscn_authenticator.main import validate_karyotype
+from iscn_authenticator.main import validate_karyotype, validate_karyotypes
 
 
 def to_json_serializable(obj):
-    """Convert dataclass instances to JSON-serializable dicts recursively."""
-    if is_dataclass(obj) and not isinstance(obj, type):
-        return {k: to_json_serializable(v) for k, v in asdict(obj).items()}
-    elif isinstance(obj, list):
+    """Convert dataclass instances to JSON-serializable dicts recursively.
+
+    Walks ``__dataclass_fields__`` directly instead of going through
+    ``dataclasses.asdict``, which would deep-copy the tree before we walk it
+    a second time.
+    """
+    fields = getattr(type(obj), "__dataclass_fields__", None)
+    if fields is not None:
+        return {f: to_json_serializable(getattr(obj, f)) for f in fields}
+    if isinstance(obj, list):
         return [to_json_serializable(item) for item in obj]
     elif isinstance(obj, dict):
         return {k: to_json_serializable(v) for k, v in obj.items()}
@@ -35,7 +45,21 @@ def to_json_serializable(obj):
         return obj
 
 
+def batch_main():
+    """Validate newline-delimited karyotypes from stdin, one process for all."""
+    karyotypes = [line.strip() for line in sys.stdin]
+    results = validate_karyotypes(k for k in karyotypes if k)
+    write = sys.stdout.write
+    for validation_result in results:
+        write(json.dumps(to_json_serializable(validation_result)))
+        write("\n")
+    sys.exit(0 if all(r.valid for r in results) else 1)
+
+
 def main():
+    if sys.argv[1:] == ["--batch"]:
+        batch_main()
+
     # Get karyotype from command line or stdin
     if len(sys.argv) > 1:
         karyotype = sys.argv[1]
@@ -0,0 +1,305 @@
+import unittest
+import sys
+import os
+from dataclasses import asdict
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# The API server has its own dependencies (api/requirements.txt plus httpx
+# for TestClient); the library suite must still run without them.
+try:
+    from fastapi.responses import JSONResponse
+    from fastapi.testclient import TestClient
+    from api.server import (
+        app, MAX_BATCH_BODY_BYTES, MAX_BATCH_SIZE, MAX_KARYOTYPE_LENGTH,
+    )
+except ImportError:
+    app = None
+
+from iscn_authenticator.main import validate_karyotype
+
+SAMPLE_KARYOTYPES = [
+    "46,XX",
+    "46,X",
+    "47,XY,+21",
+    "46,XX,del(5)(q13)",
+    "46,XY,t(9;22)(q34;q11.2)",
+    "mos 45,X[10]/46,XX[20]",
+    "foo,bar",
+]
+
+
+def _legacy_body(karyotype):
+    """Body of the JSONResponse the API built before switching to orjson."""
+    return JSONResponse(content=asdict(validate_karyotype(karyotype))).body
+
+
+@unittest.skipIf(app is None, "API dependencies are not installed")
+class TestValidateEndpoint(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app)
+
+    def test_post_valid(self):
+        response = self.client.post("/validate", json={"karyotype": "47,XY,+21"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/json")
+        body = response.json()
+        self.assertTrue(body["valid"])
+        self.assertEqual(body["errors"], [])
+        self.assertEqual(body["parsed"]["chromosome_count"], 47)
+
+    def test_post_invalid(self):
+        response = self.client.post("/validate", json={"karyotype": "46,X"})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertFalse(body["valid"])
+        self.assertTrue(body["errors"])
+
+    def test_get_matches_post(self):
+        for karyotype in SAMPLE_KARYOTYPES:
+            with self.subTest(karyotype=karyotype):
+                get = self.client.get("/validate", params={"karyotype": karyotype})
+                post = self.client.post("/validate", json={"karyotype": karyotype})
+                self.assertEqual(get.status_code, 200)
+                self.assertEqual(get.content, post.content)
+
+    def test_empty_karyotype(self):
+        self.assertEqual(
+            self.client.post("/validate", json={"karyotype": ""}).status_code, 400
+        )
+        self.assertEqual(
+            self.client.get("/validate", params={"karyotype": ""}).status_code, 400
+        )
+
+    # 422 bodies keep FastAPI's list-of-errors format for body models
+
+    def test_malformed_json(self):
+        response = self.client.post(
+            "/validate",
+            content=b"{bad",
+            headers={"content-type": "application/json"},
+        )
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json(), {"detail": [{
+            "type": "json_invalid",
+            "loc": ["body", 1],
+            "msg": "JSON decode error",
+            "input": {},
+            "ctx": {"error": "Expecting property name enclosed in double quotes"},
+        }]})
+
+    def test_empty_body(self):
+        response = self.client.post(
+            "/validate", content=b"", headers={"content-type": "application/json"}
+        )
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json(), {"detail": [{
+            "type": "missing", "loc": ["body"], "msg": "Field required", "input": None,
+        }]})
+
+    def test_missing_field(self):
+        response = self.client.post("/validate", json={"kary": "46,XX"})
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json(), {"detail": [{
+            "type": "missing",
+            "loc": ["body", "karyotype"],
+            "msg": "Field required",
+            "input": {"kary": "46,XX"},
+        }]})
+
+    def test_wrong_field_type(self):
+        response = self.client.post("/validate", json={"karyotype": 46})
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json(), {"detail": [{
+            "type": "string_type",
+            "loc": ["body", "karyotype"],
+            "msg": "Input should be a valid string",
+            "input": 46,
+        }]})
+
+    def test_not_an_object(self):
+        response = self.client.post("/validate", json=["46,XX"])
+        self.assertEqual(response.status_code, 422)
+        [error] = response.json()["detail"]
+        self.assertEqual(error["type"], "model_attributes_type")
+        self.assertEqual(error["loc"], ["body"])
+
+    def test_non_finite_number(self):
+        response = self.client.post(
+            "/validate",
+            content=b'{"karyotype": NaN}',
+            headers={"content-type": "application/json"},
+        )
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["detail"][0]["type"], "json_invalid")
+
+    def test_invalid_utf8(self):
+        response = self.client.post(
+            "/validate",
+            content=b'{"karyotype": "\xff"}',
+            headers={"content-type": "application/json"},
+        )
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["detail"][0]["type"], "json_invalid")
+
+    def test_too_long_karyotype(self):
+        karyotype = "4" * (MAX_KARYOTYPE_LENGTH + 1)
+        post = self.client.post("/validate", json={"karyotype": karyotype})
+        self.assertEqual(post.status_code, 422)
+        [error] = post.json()["detail"]
+        self.assertEqual(error["type"], "string_too_long")
+        self.assertEqual(error["loc"], ["body", "karyotype"])
+        get = self.client.get("/validate", params={"karyotype": karyotype})
+        self.assertEqual(get.status_code, 422)
+
+    def test_max_length_karyotype_accepted(self):
+        karyotype = "4" * MAX_KARYOTYPE_LENGTH
+        response = self.client.post("/validate", json={"karyotype": karyotype})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()["valid"])
+
+    def test_explanations_serialized(self):
+        # The top-level and per-abnormality explanations are part of the
+        # documented response (docs/openapi.yaml)
+        response = self.client.post(
+            "/validate", json={"karyotype": "46,XY,t(9;22)(q34;q11.2)"}
+        )
+        body = response.json()
+        self.assertIn("summary", body["explanation"])
+        for abn in body["parsed"]["abnormalities"]:
+            self.assertIn("summary", abn["explanation"])
+
+    def test_matches_legacy_json_response(self):
+        for karyotype in SAMPLE_KARYOTYPES:
+            with self.subTest(karyotype=karyotype):
+                response = self.client.post("/validate", json={"karyotype": karyotype})
+                self.assertEqual(response.content, _legacy_body(karyotype))
+
+
+@unittest.skipIf(app is None, "API dependencies are not installed")
+class TestValidateBatchEndpoint(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app)
+
+    def test_results_in_input_order(self):
+        karyotypes = ["46,XX", "46,X", "46,XX", "47,XY,+21"]
+        response = self.client.post("/validate_batch", json={"karyotypes": karyotypes})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [item["valid"] for item in response.json()], [True, False, True, True]
+        )
+
+    def test_items_match_single_endpoint(self):
+        response = self.client.post(
+            "/validate_batch", json={"karyotypes": SAMPLE_KARYOTYPES}
+        )
+        singles = [
+            self.client.post("/validate", json={"karyotype": k}).json()
+            for k in SAMPLE_KARYOTYPES
+        ]
+        self.assertEqual(response.json(), singles)
+
+    def test_matches_legacy_json_response(self):
+        response = self.client.post(
+            "/validate_batch", json={"karyotypes": SAMPLE_KARYOTYPES}
+        )
+        legacy = JSONResponse(
+            content=[asdict(validate_karyotype(k)) for k in SAMPLE_KARYOTYPES]
+        ).body
+        self.assertEqual(response.content, legacy)
+
+    def test_empty_batch(self):
+        response = self.client.post("/validate_batch", json={"karyotypes": []})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+
+    def test_max_batch_size_accepted(self):
+        response = self.client.post(
+            "/validate_batch", json={"karyotypes": ["46,XX"] * MAX_BATCH_SIZE}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), MAX_BATCH_SIZE)
+
+    def test_oversized_batch(self):
+        # Small enough to be read, so the decoder's length limit rejects it
+        response = self.client.post(
+            "/validate_batch", json={"karyotypes": ["46,XX"] * (MAX_BATCH_SIZE + 1)}
+        )
+        self.assertEqual(response.status_code, 413)
+        self.assertIn(str(MAX_BATCH_SIZE), response.json()["detail"])
+
+    def test_oversized_body(self):
+        body = b'{"karyotypes":["' + b"4" * MAX_BATCH_BODY_BYTES + b'"]}'
+        response = self.client.post(
+            "/validate_batch",
+            content=body,
+            headers={"content-type": "application/json"},
+        )
+        self.assertEqual(response.status_code, 413)
+        self.assertIn("bytes", response.json()["detail"])
+
+    def test_oversized_chunked_body(self):
+        # No Content-Length header; the limit is enforced while streaming
+        def chunks():
+            yield b'{"karyotypes":["'
+            for _ in range(MAX_BATCH_BODY_BYTES // 65536 + 1):
+                yield b"4" * 65536
+            yield b'"]}'
+
+        response = self.client.post(
+            "/validate_batch",
+            content=chunks(),
+            headers={"content-type": "application/json"},
+        )
+        self.assertEqual(response.status_code, 413)
+
+    def test_not_a_list(self):
+        response = self.client.post("/validate_batch", json={"karyotypes": "46,XX"})
+        self.assertEqual(response.status_code, 422)
+        [error] = response.json()["detail"]
+        self.assertEqual(error["type"], "list_type")
+        self.assertEqual(error["loc"], ["body", "karyotypes"])
+
+    def test_wrong_item_types(self):
+        response = self.client.post(
+            "/validate_batch", json={"karyotypes": ["46,XX", 5, None]}
+        )
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(
+            [error["loc"] for error in response.json()["detail"]],
+            [["body", "karyotypes", 1], ["body", "karyotypes", 2]],
+        )
+
+    def test_too_long_item(self):
+        karyotypes = ["46,XX", "4" * (MAX_KARYOTYPE_LENGTH + 1)]
+        response = self.client.post("/validate_batch", json={"karyotypes": karyotypes})
+        self.assertEqual(response.status_code, 422)
+        [error] = response.json()["detail"]
+        self.assertEqual(error["type"], "string_too_long")
+        self.assertEqual(error["loc"], ["body", "karyotypes", 1])
+
+
+@unittest.skipIf(app is None, "API dependencies are not installed")
+class TestServiceEndpoints(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = TestClient(app)
+
+    def test_health(self):
+        response = self.client.get("/health")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'{"status":"healthy"}')
+
+    def test_root_lists_endpoints(self):
+        endpoints = self.client.get("/").json()["endpoints"]
+        self.assertIn("POST /validate_batch", endpoints)
+
+
+if __name__ == '__main__':
+    unittest.main()
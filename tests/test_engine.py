@@ -2,7 +2,7 @@
 import unittest
 from iscn_authenticator.engine import RuleEngine
 from iscn_authenticator.rules.base import Rule
-from iscn_authenticator.models import KaryotypeAST, ValidationResult
+from iscn_authenticator.models import KaryotypeAST, ValidationResult, Abnormality
 
 
 class TestRuleEngine(unittest.TestCase):
@@ -83,6 +83,33 @@ class TestRuleEngine(unittest.TestCase):
         self.assertIn("Error 1", result.errors)
         self.assertIn("Error 2", result.errors)
 
+    def test_engine_fast_fail_stops_at_first_error(self):
+        engine = RuleEngine()
+        calls = []
+        engine.add_rule(Rule(
+            id="FAIL_1",
+            category="test",
+            description="Fails with error 1",
+            validate=lambda v, ast: calls.append("FAIL_1") or ["Error 1"]
+        ))
+        engine.add_rule(Rule(
+            id="FAIL_2",
+            category="test",
+            description="Fails with error 2",
+            validate=lambda v, ast: calls.append("FAIL_2") or ["Error 2"]
+        ))
+        ast = KaryotypeAST(
+            chromosome_count=46,
+            sex_chromosomes="XX",
+            abnormalities=[],
+            cell_lines=None,
+            modifiers=None
+        )
+        result = engine.validate(ast, fast_fail=True)
+        self.assertFalse(result.valid)
+        self.assertEqual(result.errors, ["Error 1"])
+        self.assertEqual(calls, ["FAIL_1"])
+
     def test_engine_add_rules_multiple(self):
         engine = RuleEngine()
         rules = [
@@ -106,6 +133,41 @@ class TestRuleEngine(unittest.TestCase):
         result = engine.validate(ast)
         self.assertEqual(result.parsed, ast)
 
+    def test_engine_skips_rules_for_other_types(self):
+        engine = RuleEngine()
+        engine.add_abnormality_rule(Rule(
+            id="DEL_ONLY",
+            category="test",
+            description="Fails for deletions only",
+            validate=lambda v, abn: ["Deletion error"],
+            applicable_types=frozenset({"del"})
+        ))
+        engine.add_abnormality_rule(Rule(
+            id="ANY",
+            category="test",
+            description="Fails for every abnormality",
+            validate=lambda v, abn: [f"Any error {abn.type}"]
+        ))
+        gain = Abnormality("+", "21", [], None, False, None, "+21")
+        deletion = Abnormality("del", "5", [], None, False, None, "del(5)(q13)")
+        ast = KaryotypeAST(47, "XX", [gain, deletion], None, None)
+        result = engine.validate(ast)
+        self.assertEqual(result.errors, ["Any error +", "Deletion error", "Any error del"])
+
+    def test_engine_type_index_refreshes_on_add(self):
+        engine = RuleEngine()
+        gain = Abnormality("+", "21", [], None, False, None, "+21")
+        ast = KaryotypeAST(47, "XX", [gain], None, None)
+        self.assertTrue(engine.validate(ast).valid)
+        engine.add_abnormality_rule(Rule(
+            id="GAIN_ONLY",
+            category="test",
+            description="Fails for gains",
+            validate=lambda v, abn: ["Gain error"],
+            applicable_types=frozenset({"+"})
+        ))
+        self.assertEqual(engine.validate(ast).errors, ["Gain error"])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,7 +5,8 @@ import os
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from iscn_authenticator.main import is_valid_karyotype, validate_karyotype
+from iscn_authenticator.main import is_valid_karyotype, validate_karyotype, validate_karyotypes
+from iscn_authenticator.main import _NORMAL_KARYOTYPES, _engine, _parser
 
 class TestIsValidKaryotype(unittest.TestCase):
 
@@ -41,6 +42,17 @@ class TestIsValidKaryotype(unittest.TestCase):
         # self.assertFalse(is_valid_karyotype("46,XX,del(5)q13"))  # Missing parens
         # self.assertFalse(is_valid_karyotype("46,XX,del(5)(q13q)"))  # Incomplete
 
+    def test_matches_validate_karyotype(self):
+        for karyotype in ["46,XX", "46,Y", "46XX", "47,XY,+21", "46,XX,t(9;22)(q34;q11.2)"]:
+            with self.subTest(karyotype=karyotype):
+                self.assertEqual(is_valid_karyotype(karyotype), validate_karyotype(karyotype).valid)
+
+    def test_repeated_calls_are_cached(self):
+        is_valid_karyotype("47,XXY")
+        hits = is_valid_karyotype.cache_info().hits
+        self.assertTrue(is_valid_karyotype("47,XXY"))
+        self.assertEqual(is_valid_karyotype.cache_info().hits, hits + 1)
+
 
 class TestValidateKaryotype(unittest.TestCase):
     """Tests for the new validate_karyotype() API."""
@@ -80,6 +92,37 @@ class TestValidateKaryotype(unittest.TestCase):
         self.assertFalse(result.valid)
         self.assertIn("comma", result.errors[0].lower())
 
+    def test_non_ascii_digit_gain_and_loss_invalid(self):
+        for karyotype in ("46,XX,+\uff11", "45,X,+\u0662\u0661", "46,XX,-\uff11"):
+            with self.subTest(karyotype=karyotype):
+                result = validate_karyotype(karyotype)
+                self.assertFalse(result.valid)
+                self.assertIn("Invalid chromosome", result.errors[0])
+
+    def test_explanations_populated(self):
+        result = validate_karyotype("46,XY,t(9;22)(q34;q11.2)")
+        self.assertIsNotNone(result.explanation)
+        for abn in result.parsed.abnormalities:
+            self.assertIsNotNone(abn.explanation)
+
+    def test_normal_karyotypes_match_engine(self):
+        for karyotype in _NORMAL_KARYOTYPES:
+            with self.subTest(karyotype=karyotype):
+                self.assertEqual(_engine.validate(_parser.parse(karyotype)).errors, [])
+                self.assertEqual(validate_karyotype(karyotype).parsed, _parser.parse(karyotype))
+
+
+class TestValidateKaryotypes(unittest.TestCase):
+
+    def test_results_in_input_order(self):
+        results = validate_karyotypes(["46,XX", "46XX", "47,XY,+21"])
+        self.assertEqual([r.valid for r in results], [True, False, True])
+        self.assertEqual(results[2].parsed.abnormalities[0].chromosome, "21")
+
+    def test_repeated_strings_validated_once(self):
+        results = validate_karyotypes(iter(["46,XY", "45,X", "46,XY"]))
+        self.assertIs(results[0], results[2])
+        self.assertEqual(results[1], validate_karyotype("45,X"))
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,5 @@
 # tests/test_models.py
+import dataclasses
 import unittest
 from iscn_authenticator.models import ValidationResult, KaryotypeAST, Breakpoint, Abnormality
 
@@ -24,6 +25,11 @@ class TestBreakpoint(unittest.TestCase):
         bp = Breakpoint(arm="p", region=11, band=2, subband="1", uncertain=False)
         self.assertEqual(bp.subband, "1")
 
+    def test_breakpoint_is_frozen(self):
+        bp = Breakpoint(arm="q", region=1, band=3, subband=None, uncertain=False)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            bp.arm = "p"
+
 class TestAbnormality(unittest.TestCase):
     def test_numerical_abnormality(self):
         abn = Abnormality(
@@ -38,6 +44,20 @@ class TestAbnormality(unittest.TestCase):
         self.assertEqual(abn.type, "+")
         self.assertEqual(abn.chromosome, "21")
 
+    def test_explanation_defaults_to_none(self):
+        abn = Abnormality("+", "21", [], None, False, None, "+21")
+        self.assertIsNone(abn.explanation)
+
+    def test_explanation_is_serialized(self):
+        abn = Abnormality("+", "21", [], None, False, None, "+21")
+        self.assertIn("explanation", dataclasses.asdict(abn))
+
+    def test_uses_slots(self):
+        abn = Abnormality("+", "21", [], None, False, None, "+21")
+        self.assertFalse(hasattr(abn, "__dict__"))
+        with self.assertRaises(AttributeError):
+            abn.unknown_field = True
+
 class TestKaryotypeAST(unittest.TestCase):
     def test_simple_karyotype(self):
         ast = KaryotypeAST(
@@ -50,5 +70,10 @@ class TestKaryotypeAST(unittest.TestCase):
         self.assertEqual(ast.chromosome_count, 46)
         self.assertEqual(ast.sex_chromosomes, "XX")
 
+    def test_ast_is_frozen(self):
+        ast = KaryotypeAST(46, "XX", [], None, None)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            ast.sex_chromosomes = "XY"
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,11 +1,12 @@
 # tests/test_parser.py
 import unittest
-from iscn_authenticator.parser import KaryotypeParser, ParseError
+from iscn_authenticator.parser import KaryotypeParser, ParseError, parse
 
 
 class TestKaryotypeParserBasic(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_normal_female(self):
         result = self.parser.parse("46,XX")
@@ -38,6 +39,13 @@ class TestKaryotypeParserBasic(unittest.TestCase):
         self.assertEqual(result.chromosome_count, 47)
         self.assertEqual(result.sex_chromosomes, "XYY")
 
+    def test_parse_normal_returns_fresh_ast(self):
+        first = self.parser.parse("46,XY")
+        second = self.parser.parse(" 46,XY ")
+        self.assertEqual(first, second)
+        self.assertIsNot(first.abnormalities, second.abnormalities)
+        self.assertEqual((first.chromosome_count, first.sex_chromosomes), (46, "XY"))
+
     def test_parse_undisclosed_sex(self):
         result = self.parser.parse("46,U")
         self.assertEqual(result.chromosome_count, 46)
@@ -58,6 +66,19 @@ class TestKaryotypeParserBasic(unittest.TestCase):
             self.parser.parse("foo,XX")
         self.assertIn("chromosome count", str(ctx.exception).lower())
 
+    def test_parse_signed_or_grouped_count_raises(self):
+        for karyotype in ("+46,XX", "-46,XX", "4_6,XX", "\u00b2,XX"):
+            with self.subTest(karyotype=karyotype):
+                with self.assertRaises(ParseError):
+                    self.parser.parse(karyotype)
+
+    def test_parse_invalid_sex_chromosomes_raises(self):
+        for karyotype in ("46,XZ", "46,", "46,xx"):
+            with self.subTest(karyotype=karyotype):
+                with self.assertRaises(ParseError) as ctx:
+                    self.parser.parse(karyotype)
+                self.assertIn("sex chromosomes", str(ctx.exception).lower())
+
     def test_parse_whitespace_handling(self):
         result = self.parser.parse("  46 , XX  ")
         self.assertEqual(result.chromosome_count, 46)
@@ -70,8 +91,9 @@ class TestKaryotypeParserBasic(unittest.TestCase):
 
 
 class TestParserNumericalAbnormalities(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_trisomy_21(self):
         result = self.parser.parse("47,XX,+21")
@@ -106,8 +128,9 @@ class TestParserNumericalAbnormalities(unittest.TestCase):
 
 
 class TestParserDeletions(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_terminal_deletion(self):
         result = self.parser.parse("46,XX,del(5)(q13)")
@@ -153,10 +176,18 @@ class TestParserDeletions(unittest.TestCase):
         self.assertEqual(abn.breakpoints[0].region, 3)
         self.assertEqual(abn.breakpoints[0].band, 6)
 
+    def test_parse_deletion_malformed_breakpoint_raises(self):
+        for bp in ("q", "x13", "q1.", "q1.2.3"):
+            with self.subTest(bp=bp):
+                with self.assertRaises(ParseError) as ctx:
+                    self.parser.parse(f"46,XX,del(5)({bp})")
+                self.assertIn("breakpoint format", str(ctx.exception))
+
 
 class TestParserDuplications(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_duplication(self):
         result = self.parser.parse("46,XX,dup(1)(p31p22)")
@@ -182,8 +213,9 @@ class TestParserDuplications(unittest.TestCase):
 
 
 class TestParserInversions(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_pericentric_inversion(self):
         result = self.parser.parse("46,XX,inv(9)(p12q13)")
@@ -211,8 +243,9 @@ class TestParserInversions(unittest.TestCase):
 
 
 class TestParserTranslocations(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_reciprocal_translocation(self):
         result = self.parser.parse("46,XX,t(9;22)(q34;q11.2)")
@@ -241,8 +274,9 @@ class TestParserTranslocations(unittest.TestCase):
 
 
 class TestParserIsochromosomes(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_isochromosome_short_form(self):
         """Test i(17q) - short form with arm in parentheses."""
@@ -282,8 +316,9 @@ class TestParserIsochromosomes(unittest.TestCase):
 
 
 class TestParserRingChromosomes(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_ring_simple(self):
         """Test r(1) - simple ring chromosome."""
@@ -316,8 +351,9 @@ class TestParserRingChromosomes(unittest.TestCase):
 
 
 class TestParserMarkerChromosomes(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_marker_single(self):
         """Test +mar - single marker chromosome."""
@@ -342,8 +378,9 @@ class TestParserMarkerChromosomes(unittest.TestCase):
 
 
 class TestParserDerivativeChromosomes(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_derivative_translocation(self):
         """Test der(22)t(9;22)(q34;q11.2) - Philadelphia chromosome."""
@@ -370,8 +407,9 @@ class TestParserDerivativeChromosomes(unittest.TestCase):
 
 
 class TestParserDoubleMinutesAndHSR(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_dmin(self):
         """Test dmin - double minutes."""
@@ -397,8 +435,9 @@ class TestParserDoubleMinutesAndHSR(unittest.TestCase):
 
 
 class TestParserMosaicism(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_mosaic_two_cell_lines(self):
         """Test 47,XX,+21[10]/46,XX[20] - mosaic with counts."""
@@ -438,8 +477,9 @@ class TestParserMosaicism(unittest.TestCase):
 
 
 class TestParserUncertainty(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_uncertain_numerical(self):
         """Test ?+21 - uncertain trisomy."""
@@ -471,8 +511,9 @@ class TestParserUncertainty(unittest.TestCase):
 
 
 class TestParserInheritance(unittest.TestCase):
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_maternal_deletion(self):
         """Test del(5)(q13)mat - maternal inheritance."""
@@ -513,8 +554,9 @@ class TestParserInheritance(unittest.TestCase):
 class TestParserInsertion(unittest.TestCase):
     """Tests for insertion abnormality parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_interchromosomal_insertion(self):
         """Test ins(5;2)(p14;q21q31) - segment from chr 2 inserted into chr 5."""
@@ -555,8 +597,9 @@ class TestParserInsertion(unittest.TestCase):
 class TestParserAdditionalMaterial(unittest.TestCase):
     """Tests for additional material (add) parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_add_autosome(self):
         """Test add(7)(p22) - additional material on chr 7."""
@@ -593,8 +636,9 @@ class TestParserAdditionalMaterial(unittest.TestCase):
 class TestParserTriplication(unittest.TestCase):
     """Tests for triplication (trp) parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_triplication(self):
         """Test trp(1)(q21q32) - triplication of segment."""
@@ -623,8 +667,9 @@ class TestParserTriplication(unittest.TestCase):
 class TestParserDicentric(unittest.TestCase):
     """Tests for dicentric chromosome (dic) parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_dicentric_two_chromosomes(self):
         """Test dic(13;14)(q14;q11) - dicentric from chr 13 and 14."""
@@ -653,8 +698,9 @@ class TestParserDicentric(unittest.TestCase):
 class TestParserIsodicentric(unittest.TestCase):
     """Tests for isodicentric chromosome (idic) parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_isodicentric_y(self):
         """Test idic(Y)(q11) - isodicentric Y chromosome."""
@@ -683,8 +729,9 @@ class TestParserIsodicentric(unittest.TestCase):
 class TestParserFragileSite(unittest.TestCase):
     """Tests for fragile site (fra) parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_fragile_site_x(self):
         """Test fra(X)(q27.3) - fragile X site."""
@@ -714,8 +761,9 @@ class TestParserFragileSite(unittest.TestCase):
 class TestParserRobertsonianTranslocation(unittest.TestCase):
     """Tests for Robertsonian translocation (rob) parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_rob_13_14(self):
         """Test rob(13;14)(q10;q10) - common Robertsonian translocation."""
@@ -744,8 +792,9 @@ class TestParserRobertsonianTranslocation(unittest.TestCase):
 class TestParserQuadruplication(unittest.TestCase):
     """Tests for quadruplication (qdp) parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_quadruplication(self):
         """Test qdp(1)(q21q32) - quadruplication of segment."""
@@ -774,8 +823,9 @@ class TestParserQuadruplication(unittest.TestCase):
 class TestParserPseudodicentric(unittest.TestCase):
     """Tests for pseudodicentric chromosome (psu dic) parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_pseudodicentric_two_chromosomes(self):
         """Test psu dic(13;14)(q14;q11) - pseudodicentric from chr 13 and 14."""
@@ -804,8 +854,9 @@ class TestParserPseudodicentric(unittest.TestCase):
 class TestParserAcentricFragment(unittest.TestCase):
     """Tests for acentric fragment (ace) parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_acentric_fragment(self):
         """Test ace(1)(q21q31) - acentric fragment from chr 1."""
@@ -842,8 +893,9 @@ class TestParserAcentricFragment(unittest.TestCase):
 class TestParserTelomericAssociation(unittest.TestCase):
     """Tests for telomeric association (tas) parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_telomeric_association(self):
         """Test tas(13;14)(p11;p11) - telomeric association."""
@@ -873,8 +925,9 @@ class TestParserTelomericAssociation(unittest.TestCase):
 class TestParserFission(unittest.TestCase):
     """Tests for fission (fis) parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_fission_p_arm(self):
         """Test fis(1)(p10) - fission at p arm centromere."""
@@ -911,8 +964,9 @@ class TestParserFission(unittest.TestCase):
 class TestParserNeocentromere(unittest.TestCase):
     """Tests for neocentromere (neo) parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_neocentromere(self):
         """Test neo(1)(q21) - neocentromere at chr 1 q21."""
@@ -949,8 +1003,9 @@ class TestParserNeocentromere(unittest.TestCase):
 class TestParserIncomplete(unittest.TestCase):
     """Tests for incomplete karyotype (inc) parsing."""
 
-    def setUp(self):
-        self.parser = KaryotypeParser()
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
 
     def test_parse_incomplete_simple(self):
         """Test 46,XX,inc - simple incomplete karyotype."""
@@ -975,5 +1030,76 @@ class TestParserIncomplete(unittest.TestCase):
         self.assertEqual(abn.type, "inc")
 
 
+class TestParserNonAsciiDigits(unittest.TestCase):
+    """Full-width and Arabic-Indic digits are not ISCN digits."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser()
+
+    def test_count_raises(self):
+        for karyotype in ("\uff14\uff16,XX", "\u0664\u0666,XY"):
+            with self.subTest(karyotype=karyotype):
+                with self.assertRaises(ParseError):
+                    self.parser.parse(karyotype)
+
+    def test_breakpoint_raises(self):
+        for karyotype in ("46,XX,del(5)(q\uff11\uff13)", "46,XX,del(5)(q\u0661\u0663)"):
+            with self.subTest(karyotype=karyotype):
+                with self.assertRaises(ParseError):
+                    self.parser.parse(karyotype)
+
+    def test_abnormality_raises(self):
+        for part in (
+            "+\uff11", "-\uff11", "+\u0662\u0661", "-\u0667",
+            "ace(1\uff11)", "neo(1\uff11)", "+\uff11mar", "t(9;\uff12\uff12)(q34;q11)",
+        ):
+            with self.subTest(part=part):
+                with self.assertRaisesRegex(ParseError, "Invalid chromosome"):
+                    self.parser.parse("46,XX," + part)
+
+    def test_non_strict_records_unknown(self):
+        parser = KaryotypeParser(strict=False)
+        for part in ("+\uff11", "ace(1\uff11)", "+\uff11mar"):
+            with self.subTest(part=part):
+                abn = parser.parse("46,XX," + part).abnormalities[0]
+                self.assertEqual(abn.type, "unknown")
+                self.assertEqual(abn.raw, part)
+
+class TestParserNonStrict(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = KaryotypeParser(strict=False)
+
+    def test_malformed_abnormality_becomes_unknown(self):
+        result = self.parser.parse("46,XX,del(5)(x13),?inv(9)(p12)mat,+21")
+        self.assertEqual([a.type for a in result.abnormalities], ["unknown", "unknown", "+"])
+        self.assertEqual(result.abnormalities[0].raw, "del(5)(x13)")
+        self.assertTrue(result.abnormalities[1].uncertain)
+        self.assertEqual(result.abnormalities[1].inheritance, "mat")
+
+    def test_strict_is_default(self):
+        with self.assertRaises(ParseError):
+            KaryotypeParser().parse("46,XX,del(5)(x13)")
+
+    def test_count_and_sex_still_required(self):
+        with self.assertRaises(ParseError):
+            self.parser.parse("46,XZ,+21")
+
+
+class TestModuleParse(unittest.TestCase):
+    def test_matches_parser(self):
+        karyotype = "47,XY,+21,t(9;22)(q34;q11.2)"
+        self.assertEqual(parse(karyotype), KaryotypeParser().parse(karyotype))
+
+    def test_repeated_strings_share_result(self):
+        self.assertIs(parse("46,XX,del(5)(q13)"), parse("46,XX,del(5)(q13)"))
+
+    def test_invalid_input_raises(self):
+        for _ in range(2):
+            with self.assertRaises(ParseError):
+                parse("46XX")
+
+
 if __name__ == '__main__':
     unittest.main()
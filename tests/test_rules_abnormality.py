@@ -5,6 +5,27 @@ from iscn_authenticator.rules.abnormality import (
     breakpoint_arm_valid_rule,
     inversion_two_breakpoints_rule,
     translocation_breakpoint_count_rule,
+    deletion_breakpoint_rule,
+    add_breakpoint_rule,
+    robertsonian_breakpoint_rule,
+    isodicentric_breakpoint_rule,
+    dicentric_breakpoint_rule,
+    quadruplication_breakpoint_rule,
+    triplication_breakpoint_rule,
+    isochromosome_breakpoint_rule,
+    ring_chromosome_breakpoint_rule,
+    duplication_breakpoint_rule,
+    fra_breakpoint_rule,
+    ins_breakpoint_rule,
+    dmin_breakpoint_rule,
+    hsr_breakpoint_rule,
+    mar_breakpoint_rule,
+    pseudodicentric_breakpoint_rule,
+    acentric_breakpoint_rule,
+    telomeric_association_breakpoint_rule,
+    fission_breakpoint_rule,
+    neocentromere_breakpoint_rule,
+    incomplete_breakpoint_rule,
 )
 from iscn_authenticator.models import KaryotypeAST, Abnormality, Breakpoint
 
@@ -80,6 +101,24 @@ class TestBreakpointArmRule(unittest.TestCase):
         errors = breakpoint_arm_valid_rule.validate(ast, abn)
         self.assertEqual(errors, [])
 
+    def test_applies_to_every_type(self):
+        self.assertIsNone(breakpoint_arm_valid_rule.applicable_types)
+
+    def test_checks_unlisted_structural_type(self):
+        # A type without a dedicated allow-list entry is still checked
+        bp = Breakpoint("cen", None, None, None, False)
+        abn = Abnormality("newtype", "5", [bp], None, False, None, "newtype(5)(cen)")
+        ast = KaryotypeAST(46, "XX", [abn], None, None)
+        errors = breakpoint_arm_valid_rule.validate(ast, abn)
+        self.assertEqual(len(errors), 1)
+
+    def test_skips_unknown_abnormality(self):
+        bp = Breakpoint("cen", None, None, None, False)
+        abn = Abnormality("unknown", "", [bp], None, False, None, "foo")
+        ast = KaryotypeAST(46, "XX", [abn], None, None)
+        errors = breakpoint_arm_valid_rule.validate(ast, abn)
+        self.assertEqual(errors, [])
+
 
 class TestInversionTwoBreakpointsRule(unittest.TestCase):
     def test_valid_two_breakpoints(self):
@@ -117,7 +156,6 @@ class TestInversionTwoBreakpointsRule(unittest.TestCase):
 class TestDeletionBreakpointRule(unittest.TestCase):
     def test_valid_terminal_deletion_one_breakpoint(self):
         """Terminal deletion has one breakpoint."""
-        from iscn_authenticator.rules.abnormality import deletion_breakpoint_rule
         bp1 = Breakpoint("q", 1, 3, None, False)
         abn = Abnormality("del", "5", [bp1], None, False, None, "del(5)(q13)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -126,7 +164,6 @@ class TestDeletionBreakpointRule(unittest.TestCase):
 
     def test_valid_interstitial_deletion_two_breakpoints_same_arm(self):
         """Interstitial deletion has two breakpoints on same arm."""
-        from iscn_authenticator.rules.abnormality import deletion_breakpoint_rule
         bp1 = Breakpoint("q", 1, 3, None, False)
         bp2 = Breakpoint("q", 3, 3, None, False)
         abn = Abnormality("del", "5", [bp1, bp2], None, False, None, "del(5)(q13q33)")
@@ -136,7 +173,6 @@ class TestDeletionBreakpointRule(unittest.TestCase):
 
     def test_invalid_interstitial_deletion_different_arms(self):
         """Interstitial deletion cannot have breakpoints on different arms."""
-        from iscn_authenticator.rules.abnormality import deletion_breakpoint_rule
         bp1 = Breakpoint("p", 1, 2, None, False)
         bp2 = Breakpoint("q", 1, 3, None, False)
         abn = Abnormality("del", "5", [bp1, bp2], None, False, None, "del(5)(p12q13)")
@@ -146,7 +182,6 @@ class TestDeletionBreakpointRule(unittest.TestCase):
 
     def test_invalid_deletion_three_breakpoints(self):
         """Deletion cannot have three breakpoints."""
-        from iscn_authenticator.rules.abnormality import deletion_breakpoint_rule
         bp1 = Breakpoint("q", 1, 3, None, False)
         bp2 = Breakpoint("q", 2, 1, None, False)
         bp3 = Breakpoint("q", 3, 3, None, False)
@@ -157,7 +192,6 @@ class TestDeletionBreakpointRule(unittest.TestCase):
 
     def test_skips_non_deletion(self):
         """Rule only applies to deletions."""
-        from iscn_authenticator.rules.abnormality import deletion_breakpoint_rule
         bp1 = Breakpoint("q", 1, 3, None, False)
         bp2 = Breakpoint("q", 3, 3, None, False)
         abn = Abnormality("dup", "5", [bp1, bp2], None, False, None, "dup(5)(q13q33)")
@@ -211,7 +245,6 @@ class TestTranslocationBreakpointCountRule(unittest.TestCase):
 class TestAddBreakpointRule(unittest.TestCase):
     def test_valid_add_one_breakpoint(self):
         """Add with one breakpoint."""
-        from iscn_authenticator.rules.abnormality import add_breakpoint_rule
         bp1 = Breakpoint("p", 2, 2, None, False)
         abn = Abnormality("add", "7", [bp1], None, False, None, "add(7)(p22)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -220,7 +253,6 @@ class TestAddBreakpointRule(unittest.TestCase):
 
     def test_invalid_add_no_breakpoint(self):
         """Add must have a breakpoint."""
-        from iscn_authenticator.rules.abnormality import add_breakpoint_rule
         abn = Abnormality("add", "7", [], None, False, None, "add(7)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
         errors = add_breakpoint_rule.validate(ast, abn)
@@ -228,7 +260,6 @@ class TestAddBreakpointRule(unittest.TestCase):
 
     def test_invalid_add_two_breakpoints(self):
         """Add cannot have two breakpoints."""
-        from iscn_authenticator.rules.abnormality import add_breakpoint_rule
         bp1 = Breakpoint("p", 2, 2, None, False)
         bp2 = Breakpoint("q", 1, 1, None, False)
         abn = Abnormality("add", "7", [bp1, bp2], None, False, None, "add(7)(p22q11)")
@@ -238,7 +269,6 @@ class TestAddBreakpointRule(unittest.TestCase):
 
     def test_skips_non_add(self):
         """Rule only applies to add."""
-        from iscn_authenticator.rules.abnormality import add_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("del", "5", [bp1], None, False, None, "del(5)(q21)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -249,7 +279,6 @@ class TestAddBreakpointRule(unittest.TestCase):
 class TestRobertsonianBreakpointRule(unittest.TestCase):
     def test_valid_robertsonian_two_chromosomes_two_breakpoints(self):
         """Robertsonian with two chromosomes and two breakpoints."""
-        from iscn_authenticator.rules.abnormality import robertsonian_breakpoint_rule
         bp1 = Breakpoint("q", 1, 0, None, False)
         bp2 = Breakpoint("q", 1, 0, None, False)
         abn = Abnormality("rob", "13;14", [bp1, bp2], None, False, None, "rob(13;14)(q10;q10)")
@@ -259,7 +288,6 @@ class TestRobertsonianBreakpointRule(unittest.TestCase):
 
     def test_invalid_robertsonian_two_chromosomes_one_breakpoint(self):
         """Robertsonian with two chromosomes but one breakpoint."""
-        from iscn_authenticator.rules.abnormality import robertsonian_breakpoint_rule
         bp1 = Breakpoint("q", 1, 0, None, False)
         abn = Abnormality("rob", "13;14", [bp1], None, False, None, "rob(13;14)(q10)")
         ast = KaryotypeAST(45, "XX", [abn], None, None)
@@ -268,7 +296,6 @@ class TestRobertsonianBreakpointRule(unittest.TestCase):
 
     def test_invalid_robertsonian_two_chromosomes_three_breakpoints(self):
         """Robertsonian with two chromosomes but three breakpoints."""
-        from iscn_authenticator.rules.abnormality import robertsonian_breakpoint_rule
         bp1 = Breakpoint("q", 1, 0, None, False)
         bp2 = Breakpoint("q", 1, 0, None, False)
         bp3 = Breakpoint("p", 1, 0, None, False)
@@ -279,7 +306,6 @@ class TestRobertsonianBreakpointRule(unittest.TestCase):
 
     def test_skips_non_robertsonian(self):
         """Rule only applies to Robertsonian translocations."""
-        from iscn_authenticator.rules.abnormality import robertsonian_breakpoint_rule
         bp1 = Breakpoint("q", 3, 4, None, False)
         bp2 = Breakpoint("q", 1, 1, None, False)
         abn = Abnormality("t", "9;22", [bp1, bp2], None, False, None, "t(9;22)(q34;q11)")
@@ -291,7 +317,6 @@ class TestRobertsonianBreakpointRule(unittest.TestCase):
 class TestIsodicentricBreakpointRule(unittest.TestCase):
     def test_valid_isodicentric_one_breakpoint(self):
         """Isodicentric with one breakpoint."""
-        from iscn_authenticator.rules.abnormality import isodicentric_breakpoint_rule
         bp1 = Breakpoint("q", 1, 1, None, False)
         abn = Abnormality("idic", "Y", [bp1], None, False, None, "idic(Y)(q11)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -300,7 +325,6 @@ class TestIsodicentricBreakpointRule(unittest.TestCase):
 
     def test_invalid_isodicentric_no_breakpoint(self):
         """Isodicentric must have a breakpoint."""
-        from iscn_authenticator.rules.abnormality import isodicentric_breakpoint_rule
         abn = Abnormality("idic", "Y", [], None, False, None, "idic(Y)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
         errors = isodicentric_breakpoint_rule.validate(ast, abn)
@@ -308,7 +332,6 @@ class TestIsodicentricBreakpointRule(unittest.TestCase):
 
     def test_invalid_isodicentric_two_breakpoints(self):
         """Isodicentric cannot have two breakpoints."""
-        from iscn_authenticator.rules.abnormality import isodicentric_breakpoint_rule
         bp1 = Breakpoint("q", 1, 1, None, False)
         bp2 = Breakpoint("p", 1, 1, None, False)
         abn = Abnormality("idic", "Y", [bp1, bp2], None, False, None, "idic(Y)(q11p11)")
@@ -318,7 +341,6 @@ class TestIsodicentricBreakpointRule(unittest.TestCase):
 
     def test_skips_non_isodicentric(self):
         """Rule only applies to isodicentric chromosomes."""
-        from iscn_authenticator.rules.abnormality import isodicentric_breakpoint_rule
         bp1 = Breakpoint("q", 1, 0, None, False)
         abn = Abnormality("i", "17", [bp1], None, False, None, "i(17)(q10)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -329,7 +351,6 @@ class TestIsodicentricBreakpointRule(unittest.TestCase):
 class TestDicentricBreakpointRule(unittest.TestCase):
     def test_valid_dicentric_two_chromosomes_two_breakpoints(self):
         """Dicentric with two chromosomes and two breakpoints."""
-        from iscn_authenticator.rules.abnormality import dicentric_breakpoint_rule
         bp1 = Breakpoint("q", 1, 4, None, False)
         bp2 = Breakpoint("q", 1, 1, None, False)
         abn = Abnormality("dic", "13;14", [bp1, bp2], None, False, None, "dic(13;14)(q14;q11)")
@@ -339,7 +360,6 @@ class TestDicentricBreakpointRule(unittest.TestCase):
 
     def test_invalid_dicentric_two_chromosomes_one_breakpoint(self):
         """Dicentric with two chromosomes but one breakpoint."""
-        from iscn_authenticator.rules.abnormality import dicentric_breakpoint_rule
         bp1 = Breakpoint("q", 1, 4, None, False)
         abn = Abnormality("dic", "13;14", [bp1], None, False, None, "dic(13;14)(q14)")
         ast = KaryotypeAST(45, "XX", [abn], None, None)
@@ -348,7 +368,6 @@ class TestDicentricBreakpointRule(unittest.TestCase):
 
     def test_invalid_dicentric_two_chromosomes_three_breakpoints(self):
         """Dicentric with two chromosomes but three breakpoints."""
-        from iscn_authenticator.rules.abnormality import dicentric_breakpoint_rule
         bp1 = Breakpoint("q", 1, 4, None, False)
         bp2 = Breakpoint("q", 1, 1, None, False)
         bp3 = Breakpoint("p", 1, 2, None, False)
@@ -359,7 +378,6 @@ class TestDicentricBreakpointRule(unittest.TestCase):
 
     def test_skips_non_dicentric(self):
         """Rule only applies to dicentric chromosomes."""
-        from iscn_authenticator.rules.abnormality import dicentric_breakpoint_rule
         bp1 = Breakpoint("q", 3, 4, None, False)
         bp2 = Breakpoint("q", 1, 1, None, False)
         abn = Abnormality("t", "9;22", [bp1, bp2], None, False, None, "t(9;22)(q34;q11)")
@@ -371,7 +389,6 @@ class TestDicentricBreakpointRule(unittest.TestCase):
 class TestQuadruplicationBreakpointRule(unittest.TestCase):
     def test_valid_quadruplication_two_breakpoints_same_arm(self):
         """Quadruplication with two breakpoints on same arm."""
-        from iscn_authenticator.rules.abnormality import quadruplication_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         bp2 = Breakpoint("q", 3, 2, None, False)
         abn = Abnormality("qdp", "1", [bp1, bp2], None, False, None, "qdp(1)(q21q32)")
@@ -381,7 +398,6 @@ class TestQuadruplicationBreakpointRule(unittest.TestCase):
 
     def test_invalid_quadruplication_one_breakpoint(self):
         """Quadruplication should have two breakpoints."""
-        from iscn_authenticator.rules.abnormality import quadruplication_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("qdp", "1", [bp1], None, False, None, "qdp(1)(q21)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -390,7 +406,6 @@ class TestQuadruplicationBreakpointRule(unittest.TestCase):
 
     def test_invalid_quadruplication_different_arms(self):
         """Quadruplication breakpoints must be on same arm."""
-        from iscn_authenticator.rules.abnormality import quadruplication_breakpoint_rule
         bp1 = Breakpoint("p", 1, 3, None, False)
         bp2 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("qdp", "1", [bp1, bp2], None, False, None, "qdp(1)(p13q21)")
@@ -400,7 +415,6 @@ class TestQuadruplicationBreakpointRule(unittest.TestCase):
 
     def test_skips_non_quadruplication(self):
         """Rule only applies to quadruplications."""
-        from iscn_authenticator.rules.abnormality import quadruplication_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         bp2 = Breakpoint("q", 3, 1, None, False)
         abn = Abnormality("trp", "1", [bp1, bp2], None, False, None, "trp(1)(q21q31)")
@@ -412,7 +426,6 @@ class TestQuadruplicationBreakpointRule(unittest.TestCase):
 class TestTriplicationBreakpointRule(unittest.TestCase):
     def test_valid_triplication_two_breakpoints_same_arm(self):
         """Triplication with two breakpoints on same arm."""
-        from iscn_authenticator.rules.abnormality import triplication_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         bp2 = Breakpoint("q", 3, 2, None, False)
         abn = Abnormality("trp", "1", [bp1, bp2], None, False, None, "trp(1)(q21q32)")
@@ -422,7 +435,6 @@ class TestTriplicationBreakpointRule(unittest.TestCase):
 
     def test_invalid_triplication_one_breakpoint(self):
         """Triplication should have two breakpoints."""
-        from iscn_authenticator.rules.abnormality import triplication_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("trp", "1", [bp1], None, False, None, "trp(1)(q21)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -431,7 +443,6 @@ class TestTriplicationBreakpointRule(unittest.TestCase):
 
     def test_invalid_triplication_different_arms(self):
         """Triplication breakpoints must be on same arm."""
-        from iscn_authenticator.rules.abnormality import triplication_breakpoint_rule
         bp1 = Breakpoint("p", 1, 3, None, False)
         bp2 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("trp", "1", [bp1, bp2], None, False, None, "trp(1)(p13q21)")
@@ -441,7 +452,6 @@ class TestTriplicationBreakpointRule(unittest.TestCase):
 
     def test_invalid_triplication_three_breakpoints(self):
         """Triplication cannot have three breakpoints."""
-        from iscn_authenticator.rules.abnormality import triplication_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         bp2 = Breakpoint("q", 2, 5, None, False)
         bp3 = Breakpoint("q", 3, 2, None, False)
@@ -452,7 +462,6 @@ class TestTriplicationBreakpointRule(unittest.TestCase):
 
     def test_skips_non_triplication(self):
         """Rule only applies to triplications."""
-        from iscn_authenticator.rules.abnormality import triplication_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         bp2 = Breakpoint("q", 3, 1, None, False)
         abn = Abnormality("dup", "1", [bp1, bp2], None, False, None, "dup(1)(q21q31)")
@@ -464,7 +473,6 @@ class TestTriplicationBreakpointRule(unittest.TestCase):
 class TestIsochromosomeBreakpointRule(unittest.TestCase):
     def test_valid_isochromosome_q10(self):
         """Isochromosome with q10 breakpoint (centromere)."""
-        from iscn_authenticator.rules.abnormality import isochromosome_breakpoint_rule
         bp1 = Breakpoint("q", 1, 0, None, False)
         abn = Abnormality("i", "17", [bp1], None, False, None, "i(17)(q10)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -473,7 +481,6 @@ class TestIsochromosomeBreakpointRule(unittest.TestCase):
 
     def test_valid_isochromosome_p10(self):
         """Isochromosome with p10 breakpoint (centromere)."""
-        from iscn_authenticator.rules.abnormality import isochromosome_breakpoint_rule
         bp1 = Breakpoint("p", 1, 0, None, False)
         abn = Abnormality("i", "17", [bp1], None, False, None, "i(17)(p10)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -482,7 +489,6 @@ class TestIsochromosomeBreakpointRule(unittest.TestCase):
 
     def test_invalid_isochromosome_no_breakpoint(self):
         """Isochromosome must have a breakpoint."""
-        from iscn_authenticator.rules.abnormality import isochromosome_breakpoint_rule
         abn = Abnormality("i", "17", [], None, False, None, "i(17)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
         errors = isochromosome_breakpoint_rule.validate(ast, abn)
@@ -490,7 +496,6 @@ class TestIsochromosomeBreakpointRule(unittest.TestCase):
 
     def test_invalid_isochromosome_two_breakpoints(self):
         """Isochromosome cannot have two breakpoints."""
-        from iscn_authenticator.rules.abnormality import isochromosome_breakpoint_rule
         bp1 = Breakpoint("q", 1, 0, None, False)
         bp2 = Breakpoint("p", 1, 0, None, False)
         abn = Abnormality("i", "17", [bp1, bp2], None, False, None, "i(17)(q10p10)")
@@ -500,7 +505,6 @@ class TestIsochromosomeBreakpointRule(unittest.TestCase):
 
     def test_skips_non_isochromosome(self):
         """Rule only applies to isochromosomes."""
-        from iscn_authenticator.rules.abnormality import isochromosome_breakpoint_rule
         bp1 = Breakpoint("p", 1, 2, None, False)
         bp2 = Breakpoint("q", 1, 3, None, False)
         abn = Abnormality("inv", "9", [bp1, bp2], None, False, None, "inv(9)(p12q13)")
@@ -512,7 +516,6 @@ class TestIsochromosomeBreakpointRule(unittest.TestCase):
 class TestRingChromosomeBreakpointRule(unittest.TestCase):
     def test_valid_ring_two_breakpoints_different_arms(self):
         """Ring chromosome requires two breakpoints on different arms."""
-        from iscn_authenticator.rules.abnormality import ring_chromosome_breakpoint_rule
         bp1 = Breakpoint("p", 1, 1, None, False)
         bp2 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("r", "7", [bp1, bp2], None, False, None, "r(7)(p11q21)")
@@ -522,7 +525,6 @@ class TestRingChromosomeBreakpointRule(unittest.TestCase):
 
     def test_invalid_ring_one_breakpoint(self):
         """Ring chromosome cannot have one breakpoint."""
-        from iscn_authenticator.rules.abnormality import ring_chromosome_breakpoint_rule
         bp1 = Breakpoint("p", 1, 1, None, False)
         abn = Abnormality("r", "7", [bp1], None, False, None, "r(7)(p11)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -531,7 +533,6 @@ class TestRingChromosomeBreakpointRule(unittest.TestCase):
 
     def test_invalid_ring_same_arm(self):
         """Ring chromosome breakpoints must be on different arms."""
-        from iscn_authenticator.rules.abnormality import ring_chromosome_breakpoint_rule
         bp1 = Breakpoint("p", 1, 1, None, False)
         bp2 = Breakpoint("p", 1, 3, None, False)
         abn = Abnormality("r", "7", [bp1, bp2], None, False, None, "r(7)(p11p13)")
@@ -541,7 +542,6 @@ class TestRingChromosomeBreakpointRule(unittest.TestCase):
 
     def test_invalid_ring_three_breakpoints(self):
         """Ring chromosome cannot have three breakpoints."""
-        from iscn_authenticator.rules.abnormality import ring_chromosome_breakpoint_rule
         bp1 = Breakpoint("p", 1, 1, None, False)
         bp2 = Breakpoint("q", 2, 1, None, False)
         bp3 = Breakpoint("q", 3, 1, None, False)
@@ -552,7 +552,6 @@ class TestRingChromosomeBreakpointRule(unittest.TestCase):
 
     def test_skips_non_ring(self):
         """Rule only applies to ring chromosomes."""
-        from iscn_authenticator.rules.abnormality import ring_chromosome_breakpoint_rule
         bp1 = Breakpoint("p", 1, 2, None, False)
         bp2 = Breakpoint("q", 1, 3, None, False)
         abn = Abnormality("inv", "9", [bp1, bp2], None, False, None, "inv(9)(p12q13)")
@@ -564,7 +563,6 @@ class TestRingChromosomeBreakpointRule(unittest.TestCase):
 class TestDuplicationBreakpointRule(unittest.TestCase):
     def test_valid_tandem_duplication_one_breakpoint(self):
         """Tandem duplication has one breakpoint."""
-        from iscn_authenticator.rules.abnormality import duplication_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("dup", "1", [bp1], None, False, None, "dup(1)(q21)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -573,7 +571,6 @@ class TestDuplicationBreakpointRule(unittest.TestCase):
 
     def test_valid_duplication_two_breakpoints_same_arm(self):
         """Duplication with two breakpoints on same arm."""
-        from iscn_authenticator.rules.abnormality import duplication_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         bp2 = Breakpoint("q", 3, 1, None, False)
         abn = Abnormality("dup", "1", [bp1, bp2], None, False, None, "dup(1)(q21q31)")
@@ -583,7 +580,6 @@ class TestDuplicationBreakpointRule(unittest.TestCase):
 
     def test_invalid_duplication_different_arms(self):
         """Duplication cannot have breakpoints on different arms."""
-        from iscn_authenticator.rules.abnormality import duplication_breakpoint_rule
         bp1 = Breakpoint("p", 1, 2, None, False)
         bp2 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("dup", "1", [bp1, bp2], None, False, None, "dup(1)(p12q21)")
@@ -593,7 +589,6 @@ class TestDuplicationBreakpointRule(unittest.TestCase):
 
     def test_invalid_duplication_three_breakpoints(self):
         """Duplication cannot have three breakpoints."""
-        from iscn_authenticator.rules.abnormality import duplication_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         bp2 = Breakpoint("q", 2, 5, None, False)
         bp3 = Breakpoint("q", 3, 1, None, False)
@@ -604,7 +599,6 @@ class TestDuplicationBreakpointRule(unittest.TestCase):
 
     def test_skips_non_duplication(self):
         """Rule only applies to duplications."""
-        from iscn_authenticator.rules.abnormality import duplication_breakpoint_rule
         bp1 = Breakpoint("q", 1, 3, None, False)
         bp2 = Breakpoint("q", 3, 3, None, False)
         abn = Abnormality("del", "5", [bp1, bp2], None, False, None, "del(5)(q13q33)")
@@ -616,7 +610,6 @@ class TestDuplicationBreakpointRule(unittest.TestCase):
 class TestFraBreakpointRule(unittest.TestCase):
     def test_valid_fra_one_breakpoint(self):
         """Fragile site with one breakpoint."""
-        from iscn_authenticator.rules.abnormality import fra_breakpoint_rule
         bp1 = Breakpoint("q", 2, 7, 3, False)
         abn = Abnormality("fra", "X", [bp1], None, False, None, "fra(X)(q27.3)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -625,7 +618,6 @@ class TestFraBreakpointRule(unittest.TestCase):
 
     def test_invalid_fra_no_breakpoint(self):
         """Fragile site must have a breakpoint."""
-        from iscn_authenticator.rules.abnormality import fra_breakpoint_rule
         abn = Abnormality("fra", "X", [], None, False, None, "fra(X)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
         errors = fra_breakpoint_rule.validate(ast, abn)
@@ -633,7 +625,6 @@ class TestFraBreakpointRule(unittest.TestCase):
 
     def test_skips_non_fra(self):
         """Rule only applies to fragile sites."""
-        from iscn_authenticator.rules.abnormality import fra_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("del", "5", [bp1], None, False, None, "del(5)(q21)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -644,7 +635,6 @@ class TestFraBreakpointRule(unittest.TestCase):
 class TestInsBreakpointRule(unittest.TestCase):
     def test_valid_ins_three_breakpoints(self):
         """Insertion with three breakpoints."""
-        from iscn_authenticator.rules.abnormality import ins_breakpoint_rule
         bp1 = Breakpoint("p", 1, 4, None, False)
         bp2 = Breakpoint("q", 2, 1, None, False)
         bp3 = Breakpoint("q", 3, 1, None, False)
@@ -655,7 +645,6 @@ class TestInsBreakpointRule(unittest.TestCase):
 
     def test_invalid_ins_two_breakpoints(self):
         """Insertion must have three breakpoints."""
-        from iscn_authenticator.rules.abnormality import ins_breakpoint_rule
         bp1 = Breakpoint("p", 1, 4, None, False)
         bp2 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("ins", "5;2", [bp1, bp2], None, False, None, "ins(5;2)(p14;q21)")
@@ -665,7 +654,6 @@ class TestInsBreakpointRule(unittest.TestCase):
 
     def test_skips_non_ins(self):
         """Rule only applies to insertions."""
-        from iscn_authenticator.rules.abnormality import ins_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         bp2 = Breakpoint("q", 3, 1, None, False)
         abn = Abnormality("dup", "1", [bp1, bp2], None, False, None, "dup(1)(q21q31)")
@@ -677,7 +665,6 @@ class TestInsBreakpointRule(unittest.TestCase):
 class TestDminBreakpointRule(unittest.TestCase):
     def test_valid_dmin_no_breakpoints(self):
         """Double minutes with no breakpoints."""
-        from iscn_authenticator.rules.abnormality import dmin_breakpoint_rule
         abn = Abnormality("dmin", "", [], None, False, None, "dmin")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
         errors = dmin_breakpoint_rule.validate(ast, abn)
@@ -685,7 +672,6 @@ class TestDminBreakpointRule(unittest.TestCase):
 
     def test_invalid_dmin_with_breakpoint(self):
         """Double minutes should have no breakpoints."""
-        from iscn_authenticator.rules.abnormality import dmin_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("dmin", "", [bp1], None, False, None, "dmin(q21)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -694,7 +680,6 @@ class TestDminBreakpointRule(unittest.TestCase):
 
     def test_skips_non_dmin(self):
         """Rule only applies to double minutes."""
-        from iscn_authenticator.rules.abnormality import dmin_breakpoint_rule
         abn = Abnormality("hsr", "", [], None, False, None, "hsr")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
         errors = dmin_breakpoint_rule.validate(ast, abn)
@@ -704,7 +689,6 @@ class TestDminBreakpointRule(unittest.TestCase):
 class TestHsrBreakpointRule(unittest.TestCase):
     def test_valid_hsr_no_breakpoints(self):
         """HSR with no breakpoints."""
-        from iscn_authenticator.rules.abnormality import hsr_breakpoint_rule
         abn = Abnormality("hsr", "", [], None, False, None, "hsr")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
         errors = hsr_breakpoint_rule.validate(ast, abn)
@@ -712,7 +696,6 @@ class TestHsrBreakpointRule(unittest.TestCase):
 
     def test_valid_hsr_one_breakpoint(self):
         """HSR with one breakpoint (location specified)."""
-        from iscn_authenticator.rules.abnormality import hsr_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("hsr", "1", [bp1], None, False, None, "hsr(1)(q21)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -721,7 +704,6 @@ class TestHsrBreakpointRule(unittest.TestCase):
 
     def test_invalid_hsr_two_breakpoints(self):
         """HSR should have at most one breakpoint."""
-        from iscn_authenticator.rules.abnormality import hsr_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         bp2 = Breakpoint("q", 3, 1, None, False)
         abn = Abnormality("hsr", "1", [bp1, bp2], None, False, None, "hsr(1)(q21q31)")
@@ -731,7 +713,6 @@ class TestHsrBreakpointRule(unittest.TestCase):
 
     def test_skips_non_hsr(self):
         """Rule only applies to HSR."""
-        from iscn_authenticator.rules.abnormality import hsr_breakpoint_rule
         abn = Abnormality("dmin", "", [], None, False, None, "dmin")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
         errors = hsr_breakpoint_rule.validate(ast, abn)
@@ -741,7 +722,6 @@ class TestHsrBreakpointRule(unittest.TestCase):
 class TestMarBreakpointRule(unittest.TestCase):
     def test_valid_mar_no_breakpoints(self):
         """Marker chromosome with no breakpoints."""
-        from iscn_authenticator.rules.abnormality import mar_breakpoint_rule
         abn = Abnormality("mar", "", [], None, False, None, "+mar")
         ast = KaryotypeAST(47, "XX", [abn], None, None)
         errors = mar_breakpoint_rule.validate(ast, abn)
@@ -749,7 +729,6 @@ class TestMarBreakpointRule(unittest.TestCase):
 
     def test_invalid_mar_with_breakpoint(self):
         """Marker chromosome should have no breakpoints."""
-        from iscn_authenticator.rules.abnormality import mar_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("mar", "", [bp1], None, False, None, "+mar(q21)")
         ast = KaryotypeAST(47, "XX", [abn], None, None)
@@ -758,7 +737,6 @@ class TestMarBreakpointRule(unittest.TestCase):
 
     def test_skips_non_mar(self):
         """Rule only applies to marker chromosomes."""
-        from iscn_authenticator.rules.abnormality import mar_breakpoint_rule
         abn = Abnormality("dmin", "", [], None, False, None, "dmin")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
         errors = mar_breakpoint_rule.validate(ast, abn)
@@ -768,7 +746,6 @@ class TestMarBreakpointRule(unittest.TestCase):
 class TestPseudicentricBreakpointRule(unittest.TestCase):
     def test_valid_pseudodicentric_two_chromosomes(self):
         """Pseudodicentric with two chromosomes and two breakpoints."""
-        from iscn_authenticator.rules.abnormality import pseudodicentric_breakpoint_rule
         bp1 = Breakpoint("q", 1, 4, None, False)
         bp2 = Breakpoint("q", 1, 1, None, False)
         abn = Abnormality("psu dic", "13;14", [bp1, bp2], None, False, None, "psu dic(13;14)(q14;q11)")
@@ -778,7 +755,6 @@ class TestPseudicentricBreakpointRule(unittest.TestCase):
 
     def test_invalid_pseudodicentric_mismatched(self):
         """Pseudodicentric with chromosome/breakpoint mismatch."""
-        from iscn_authenticator.rules.abnormality import pseudodicentric_breakpoint_rule
         bp1 = Breakpoint("q", 1, 4, None, False)
         abn = Abnormality("psu dic", "13;14", [bp1], None, False, None, "psu dic(13;14)(q14)")
         ast = KaryotypeAST(45, "XX", [abn], None, None)
@@ -787,7 +763,6 @@ class TestPseudicentricBreakpointRule(unittest.TestCase):
 
     def test_skips_non_pseudodicentric(self):
         """Rule only applies to pseudodicentric."""
-        from iscn_authenticator.rules.abnormality import pseudodicentric_breakpoint_rule
         bp1 = Breakpoint("q", 1, 4, None, False)
         bp2 = Breakpoint("q", 1, 1, None, False)
         abn = Abnormality("dic", "13;14", [bp1, bp2], None, False, None, "dic(13;14)(q14;q11)")
@@ -799,7 +774,6 @@ class TestPseudicentricBreakpointRule(unittest.TestCase):
 class TestAcentricBreakpointRule(unittest.TestCase):
     def test_valid_acentric_one_breakpoint(self):
         """Acentric with one breakpoint."""
-        from iscn_authenticator.rules.abnormality import acentric_breakpoint_rule
         bp1 = Breakpoint("p", 1, 5, None, False)
         abn = Abnormality("ace", "5", [bp1], None, False, None, "ace(5)(p15)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -808,7 +782,6 @@ class TestAcentricBreakpointRule(unittest.TestCase):
 
     def test_valid_acentric_two_breakpoints(self):
         """Acentric with two breakpoints."""
-        from iscn_authenticator.rules.abnormality import acentric_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         bp2 = Breakpoint("q", 3, 1, None, False)
         abn = Abnormality("ace", "1", [bp1, bp2], None, False, None, "ace(1)(q21q31)")
@@ -818,7 +791,6 @@ class TestAcentricBreakpointRule(unittest.TestCase):
 
     def test_invalid_acentric_no_breakpoints(self):
         """Acentric must have at least one breakpoint."""
-        from iscn_authenticator.rules.abnormality import acentric_breakpoint_rule
         abn = Abnormality("ace", "1", [], None, False, None, "ace(1)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
         errors = acentric_breakpoint_rule.validate(ast, abn)
@@ -826,7 +798,6 @@ class TestAcentricBreakpointRule(unittest.TestCase):
 
     def test_invalid_acentric_three_breakpoints(self):
         """Acentric must have at most two breakpoints."""
-        from iscn_authenticator.rules.abnormality import acentric_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         bp2 = Breakpoint("q", 2, 5, None, False)
         bp3 = Breakpoint("q", 3, 1, None, False)
@@ -837,7 +808,6 @@ class TestAcentricBreakpointRule(unittest.TestCase):
 
     def test_skips_non_acentric(self):
         """Rule only applies to acentric fragments."""
-        from iscn_authenticator.rules.abnormality import acentric_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("del", "1", [bp1], None, False, None, "del(1)(q21)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -848,7 +818,6 @@ class TestAcentricBreakpointRule(unittest.TestCase):
 class TestTelomericAssociationBreakpointRule(unittest.TestCase):
     def test_valid_tas_two_chromosomes(self):
         """Telomeric association with two chromosomes and two breakpoints."""
-        from iscn_authenticator.rules.abnormality import telomeric_association_breakpoint_rule
         bp1 = Breakpoint("p", 1, 1, None, False)
         bp2 = Breakpoint("p", 1, 1, None, False)
         abn = Abnormality("tas", "13;14", [bp1, bp2], None, False, None, "tas(13;14)(p11;p11)")
@@ -858,7 +827,6 @@ class TestTelomericAssociationBreakpointRule(unittest.TestCase):
 
     def test_valid_tas_three_chromosomes(self):
         """Telomeric association with three chromosomes and three breakpoints."""
-        from iscn_authenticator.rules.abnormality import telomeric_association_breakpoint_rule
         bp1 = Breakpoint("p", 1, 1, None, False)
         bp2 = Breakpoint("p", 1, 1, None, False)
         bp3 = Breakpoint("p", 1, 1, None, False)
@@ -869,7 +837,6 @@ class TestTelomericAssociationBreakpointRule(unittest.TestCase):
 
     def test_invalid_tas_mismatched(self):
         """Telomeric association with chromosome/breakpoint mismatch."""
-        from iscn_authenticator.rules.abnormality import telomeric_association_breakpoint_rule
         bp1 = Breakpoint("p", 1, 1, None, False)
         abn = Abnormality("tas", "13;14", [bp1], None, False, None, "tas(13;14)(p11)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -878,7 +845,6 @@ class TestTelomericAssociationBreakpointRule(unittest.TestCase):
 
     def test_skips_non_tas(self):
         """Rule only applies to telomeric associations."""
-        from iscn_authenticator.rules.abnormality import telomeric_association_breakpoint_rule
         bp1 = Breakpoint("q", 1, 4, None, False)
         bp2 = Breakpoint("q", 1, 1, None, False)
         abn = Abnormality("dic", "13;14", [bp1, bp2], None, False, None, "dic(13;14)(q14;q11)")
@@ -890,7 +856,6 @@ class TestTelomericAssociationBreakpointRule(unittest.TestCase):
 class TestFissionBreakpointRule(unittest.TestCase):
     def test_valid_fission_one_breakpoint(self):
         """Fission with one breakpoint."""
-        from iscn_authenticator.rules.abnormality import fission_breakpoint_rule
         bp1 = Breakpoint("p", 1, 0, None, False)
         abn = Abnormality("fis", "1", [bp1], None, False, None, "fis(1)(p10)")
         ast = KaryotypeAST(47, "XX", [abn], None, None)
@@ -899,7 +864,6 @@ class TestFissionBreakpointRule(unittest.TestCase):
 
     def test_invalid_fission_no_breakpoint(self):
         """Fission must have a breakpoint."""
-        from iscn_authenticator.rules.abnormality import fission_breakpoint_rule
         abn = Abnormality("fis", "1", [], None, False, None, "fis(1)")
         ast = KaryotypeAST(47, "XX", [abn], None, None)
         errors = fission_breakpoint_rule.validate(ast, abn)
@@ -907,7 +871,6 @@ class TestFissionBreakpointRule(unittest.TestCase):
 
     def test_invalid_fission_two_breakpoints(self):
         """Fission should have only one breakpoint."""
-        from iscn_authenticator.rules.abnormality import fission_breakpoint_rule
         bp1 = Breakpoint("p", 1, 0, None, False)
         bp2 = Breakpoint("q", 1, 0, None, False)
         abn = Abnormality("fis", "1", [bp1, bp2], None, False, None, "fis(1)(p10q10)")
@@ -917,7 +880,6 @@ class TestFissionBreakpointRule(unittest.TestCase):
 
     def test_skips_non_fission(self):
         """Rule only applies to fissions."""
-        from iscn_authenticator.rules.abnormality import fission_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("del", "1", [bp1], None, False, None, "del(1)(q21)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -928,7 +890,6 @@ class TestFissionBreakpointRule(unittest.TestCase):
 class TestNeocentromereBreakpointRule(unittest.TestCase):
     def test_valid_neocentromere_one_breakpoint(self):
         """Neocentromere with one breakpoint."""
-        from iscn_authenticator.rules.abnormality import neocentromere_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("neo", "1", [bp1], None, False, None, "neo(1)(q21)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -937,7 +898,6 @@ class TestNeocentromereBreakpointRule(unittest.TestCase):
 
     def test_invalid_neocentromere_no_breakpoint(self):
         """Neocentromere must have a breakpoint."""
-        from iscn_authenticator.rules.abnormality import neocentromere_breakpoint_rule
         abn = Abnormality("neo", "1", [], None, False, None, "neo(1)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
         errors = neocentromere_breakpoint_rule.validate(ast, abn)
@@ -945,7 +905,6 @@ class TestNeocentromereBreakpointRule(unittest.TestCase):
 
     def test_invalid_neocentromere_two_breakpoints(self):
         """Neocentromere should have only one breakpoint."""
-        from iscn_authenticator.rules.abnormality import neocentromere_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         bp2 = Breakpoint("q", 2, 4, None, False)
         abn = Abnormality("neo", "1", [bp1, bp2], None, False, None, "neo(1)(q21q24)")
@@ -955,7 +914,6 @@ class TestNeocentromereBreakpointRule(unittest.TestCase):
 
     def test_skips_non_neocentromere(self):
         """Rule only applies to neocentromeres."""
-        from iscn_authenticator.rules.abnormality import neocentromere_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("del", "1", [bp1], None, False, None, "del(1)(q21)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -966,7 +924,6 @@ class TestNeocentromereBreakpointRule(unittest.TestCase):
 class TestIncompleteBreakpointRule(unittest.TestCase):
     def test_valid_incomplete_no_breakpoints(self):
         """Incomplete marker with no breakpoints."""
-        from iscn_authenticator.rules.abnormality import incomplete_breakpoint_rule
         abn = Abnormality("inc", "", [], None, False, None, "inc")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
         errors = incomplete_breakpoint_rule.validate(ast, abn)
@@ -974,7 +931,6 @@ class TestIncompleteBreakpointRule(unittest.TestCase):
 
     def test_invalid_incomplete_with_breakpoint(self):
         """Incomplete marker should have no breakpoints."""
-        from iscn_authenticator.rules.abnormality import incomplete_breakpoint_rule
         bp1 = Breakpoint("q", 2, 1, None, False)
         abn = Abnormality("inc", "", [bp1], None, False, None, "inc(q21)")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
@@ -983,7 +939,6 @@ class TestIncompleteBreakpointRule(unittest.TestCase):
 
     def test_skips_non_incomplete(self):
         """Rule only applies to incomplete markers."""
-        from iscn_authenticator.rules.abnormality import incomplete_breakpoint_rule
         abn = Abnormality("dmin", "", [], None, False, None, "dmin")
         ast = KaryotypeAST(46, "XX", [abn], None, None)
         errors = incomplete_breakpoint_rule.validate(ast, abn)
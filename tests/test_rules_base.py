@@ -1,4 +1,5 @@
 # tests/test_rules_base.py
+import dataclasses
 import unittest
 from iscn_authenticator.rules.base import Rule
 from iscn_authenticator.models import KaryotypeAST
@@ -43,5 +44,15 @@ class TestRule(unittest.TestCase):
         errors = rule.validate(45, None)
         self.assertEqual(errors, ["Expected 46, got 45"])
 
+    def test_rule_is_frozen(self):
+        rule = Rule(
+            id="CHR_COUNT_46",
+            category="chromosome_count",
+            description="Test rule",
+            validate=lambda value, ast: []
+        )
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            rule.id = "OTHER"
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+SCRIPT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', 'scripts', 'validate_json.py')
+)
+
+
+def run_script(*args, stdin=""):
+    return subprocess.run(
+        [sys.executable, SCRIPT, *args],
+        input=stdin,
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestValidateJsonBatch(unittest.TestCase):
+
+    def test_output_order_matches_input(self):
+        karyotypes = ["47,XY,+21", "46,X", "46,XX", "46,XX,del(5)(q13)", "46,X"]
+        result = run_script("--batch", stdin="\n".join(karyotypes) + "\n")
+        lines = result.stdout.splitlines()
+        self.assertEqual(len(lines), len(karyotypes))
+        self.assertEqual(
+            [json.loads(line)["valid"] for line in lines],
+            [True, False, True, True, False],
+        )
+        self.assertEqual(json.loads(lines[0])["parsed"]["chromosome_count"], 47)
+
+    def test_one_compact_object_per_line(self):
+        result = run_script("--batch", stdin="46,XX\n")
+        self.assertEqual(result.stdout.count("\n"), 1)
+        self.assertEqual(json.loads(result.stdout)["errors"], [])
+
+    def test_blank_lines_skipped(self):
+        result = run_script("--batch", stdin="\n46,XX\n   \n\n47,XY,+21\n\n")
+        self.assertEqual(result.returncode, 0)
+        lines = result.stdout.splitlines()
+        self.assertEqual(
+            [json.loads(line)["parsed"]["chromosome_count"] for line in lines],
+            [46, 47],
+        )
+
+    def test_exit_zero_when_all_valid(self):
+        result = run_script("--batch", stdin="46,XX\n46,XY\n")
+        self.assertEqual(result.returncode, 0)
+
+    def test_exit_nonzero_when_any_invalid(self):
+        result = run_script("--batch", stdin="46,XX\nfoo,bar\n46,XY\n")
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(len(result.stdout.splitlines()), 3)
+
+    def test_empty_input(self):
+        result = run_script("--batch", stdin="")
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, "")
+
+
+if __name__ == '__main__':
+    unittest.main()